@@ -1,13 +1,19 @@
-from itertools import product
+from typing import Iterator
 import os
-from cwru.cwru import generate_query_url
+from cwru.cwru import generate_prefix_urls
+from cwru.parser import extract_emails_bytes
+from cwru.browser_pool import BrowserPool
+from cwru.session import (
+    LOGIN_URL,
+    AuthenticatedSession,
+    SeleniumSessionProvider,
+    selenium_login,
+)
 from log import Logger
 from selenium.webdriver.chrome.service import Service
 from selenium import webdriver
-from scraper import BatchScraper
-import re
+from scraper import BatchScraper, PackStore
 import dotenv
-from selenium.webdriver.common.by import By
 
 """
 To use this module you must have a .env file in the root directory with the following variables:
@@ -31,8 +37,9 @@ This module follows a very similar approach to the brute_force.py module, but wi
 - The scraping function remains the same.
 
 Working with the selenium library has provided an insight on authentication:
-* It might be done through a cookie, but I'm not sure.
-    * Investing time into this would be a good idea. Since it would speed up the process of requesting.
+* It is done through a cookie.
+    * `cwru.session.AuthenticatedSession` logs in once with selenium and sends the exported cookies
+      over pooled keep-alive connections, logging in again only when a page shows the session expired.
     
 Additionally, I have noticed that the query results website has no ids, which makes parsing harder so
 I stuck to the regex parser for this example.
@@ -40,76 +47,72 @@ I stuck to the regex parser for this example.
 
 dotenv.load_dotenv()
 
-logger: Logger = Logger(print_=True, file_=True, file_path="auth_request_log.rlog")
+logger: Logger = Logger(
+    print_=True, file_=True, file_path="auth_request_log.rlog", buffered=True
+)
 
 
-def request_func(url: str) -> None:
+def start_driver() -> webdriver.Chrome:
     """
-    HTML request function using Selenium chromedriver.
-    This is a very slow process, and is definitely not the most elegant way of providing authentication.
-    But it is A WAY of providing authentication.
-
-    Args:
-        url (str): URL to request.
+    Start a chromedriver.
 
     Returns:
-        str: HTML source.
+        webdriver.Chrome: driver.
     """
-
-    # set up chrome driver
     service: Service = Service(executable_path="web_drivers/chromedriver.exe")
-    driver: webdriver.Chrome = webdriver.Chrome(service=service)
-
-    # open url
-    driver.get(url)
-
-    try:
-        # find the login prompt
-        driver.find_element(By.PARTIAL_LINK_TEXT, "log in").click()
-        
-        # enter credentials
-        driver.find_element(By.ID, "username").send_keys(os.getenv("CWRU_USERNAME"))
-        driver.find_element(By.ID, "password").send_keys(os.getenv("CWRU_PASSWORD"))
-        driver.find_element(By.ID, "login-submit").click()
-    except:
-        """
-        ignore the exception, because presumable the login prompt has not been found, which means that there are no results.
-        or less than 10 results.
-        in the case that there are no results this is ingored
-        in the case that there are less than 10 results, the data is still scraped.
-        """ 
-        pass
-
-    # get html source
-    html: str = driver.page_source
-
-    # return html source
-    return html
-
-
-# create a list of urls to scrape
-urls: list[str] = [
-    generate_query_url(seach_text=query, category="student")
-    for query in [
-        f"{''.join(c)}*" for c in product("abcdefghijklmnopqrstuvwxyz", repeat=2)
-    ]
-]
+    return webdriver.Chrome(service=service)
+
+
+# long lived, already logged in browsers, each one is replaced after 100 pages
+browser_pool: BrowserPool = BrowserPool(
+    factory=start_driver,
+    size=4,
+    max_pages=100,
+    setup=lambda driver: selenium_login(
+        driver, os.getenv("CWRU_USERNAME"), os.getenv("CWRU_PASSWORD"), LOGIN_URL
+    ),
+)
+
+# lazily generate the urls to scrape, they are produced once as the scraper consumes them
+total: int = 26**2
+urls: Iterator[str] = generate_prefix_urls(2, category="student")
+
+# log in once with selenium and reuse the session cookies for every query,
+# set CWRU_COOKIE_SESSION=0 to fall back to a pool of logged in browsers
+use_cookie_session: bool = os.getenv("CWRU_COOKIE_SESSION", "1") != "0"
+
+session: AuthenticatedSession = AuthenticatedSession(
+    SeleniumSessionProvider(
+        username=os.getenv("CWRU_USERNAME"), password=os.getenv("CWRU_PASSWORD")
+    )
+)
 
 # create a scraper
 scraper: BatchScraper = BatchScraper(
     url=urls,
-    request_func=request_func,
-    scrape_func=lambda html: list(set(re.findall("[\w\.-]+@case.edu+", html))),
+    request_func=session.request if use_cookie_session else browser_pool.request,
+    scrape_func=extract_emails_bytes,
     path="dump",
+    # keep pages deduplicated and compressed in a single pack file instead of one file per query
+    store=PackStore("dump"),
+    # resume an interrupted run
+    journal="dump/journal.log",
 )
 
 # run the scraper
 results: list[list[str]] = scraper.run(
-    request_callback=lambda i, url: logger.log(f"Requesting {i} of {len(urls)}: {url}"),
-    scrape_callback=lambda i, url: logger.log(f"Scraping {i} of {len(urls)}: {url}"),
-    delete_after_use=False
+    request_callback=lambda i, url: logger.log(f"Requesting {i} of {total}: {url}"),
+    scrape_callback=lambda i, url: logger.log(f"Scraping {i} of {total}: {url}"),
+    delete_after_use=False,
+    # scrape the stored bytes instead of decoding every 250 row page to a string
+    mapped=True,
+    # request on one thread per browser of the pool, the cookie session is thread safe as well
+    workers=browser_pool.size,
 )
 
+session.close()
+browser_pool.close()
+
 # flatten the results
 results: list[str] = [r for r in results for r in r]
 
@@ -0,0 +1,77 @@
+import re
+import sys
+from pathlib import Path
+from timeit import timeit
+from cwru.parser import extract_emails, extract_emails_bytes, parse_records
+from scraper import FileStore, PackStore, PageStore
+
+"""
+Benchmark of the directory result parsers against the regex lambda used by the scripts,
+on pages saved by `BatchScraper` with `delete_after_use=False`, in a `PackStore` if the directory has a
+`pages.idx` and a `FileStore` otherwise.
+
+Run from the repository root with `python -m benchmarks.bench_parser [path]`, `path` defaults to "dump".
+"""
+
+NUMBER: int = 20
+
+
+def legacy(html: str) -> list[str]:
+    return list(set(re.findall("[\\w\\.-]+@case.edu+", html)))
+
+
+if __name__ == "__main__":
+    path: Path = Path(sys.argv[1] if len(sys.argv) > 1 else "dump")
+
+    # read through the store the pages were saved with
+    store: PageStore = (
+        PackStore(path) if (path / "pages.idx").exists() else FileStore(path)
+    )
+    indexes: list[int] = store.indexes()
+    pages: list[str] = [store.get(i) for i in indexes]
+
+    if not pages:
+        sys.exit(f"No saved pages found in '{path}'.")
+
+    parsers = {
+        "legacy": legacy,
+        "extract_emails": extract_emails,
+        "parse_records": parse_records,
+    }
+    results: dict[str, float] = {
+        name: timeit(lambda: [parser(page) for page in pages], number=NUMBER)
+        for name, parser in parsers.items()
+    }
+
+    size: int = sum(len(page) for page in pages)
+    print(f"{len(pages)} pages, {size / 1e6:.1f} MB")
+
+    for name, seconds in results.items():
+        print(
+            f"{name.ljust(15)} {seconds / NUMBER / len(pages) * 1e6:10.1f} us/page"
+            f"  {size * NUMBER / seconds / 1e6:8.1f} MB/s"
+            f"  {results['legacy'] / seconds:6.2f}x"
+        )
+
+    # read back from disk as `BatchScraper.batch_scrape` does, decoded or memory mapped
+    def mapped() -> None:
+        for i in indexes:
+            with store.view(i) as page:
+                extract_emails_bytes(page)
+
+    readback: dict[str, float] = {
+        "read_text": timeit(
+            lambda: [extract_emails(store.get(i)) for i in indexes], number=NUMBER
+        ),
+        "mapped": timeit(mapped, number=NUMBER),
+    }
+
+    for name, seconds in readback.items():
+        print(
+            f"{name.ljust(15)} {seconds / NUMBER / len(indexes) * 1e6:10.1f} us/page"
+            f"  {readback['read_text'] / seconds:6.2f}x"
+        )
+
+    emails: int = sum(len(extract_emails(page)) for page in pages)
+    records: int = sum(len(parse_records(page)) for page in pages)
+    print(f"{emails} emails, {records} records")
@@ -0,0 +1,255 @@
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+from types import NoneType
+from typing import Any, Callable
+from urllib.request import urlopen
+from benchmarks.fake_directory import FakeDirectory
+from cwru import keep_alive_request_func
+from cwru.cwru import generate_query_urls
+from cwru.parser import extract_emails
+from scraper import (
+    AsyncScraper,
+    BatchScraper,
+    ConcurrentScraper,
+    Metrics,
+    PackStore,
+    RequestScheduler,
+    SequentialScraper,
+)
+
+"""
+Throughput benchmark of the scrapers against a local fake directory server.
+
+Every engine runs in its own process and scrapes the same `prefix*` queries, prefixes of names in the
+fake population so every page has results, reporting urls per second, peak RSS, bytes written to disk,
+parse time and request latency. With `--scheduler` requests go through a `RequestScheduler`, and the
+server can fail or throttle a share of them to measure its retries and backoff. Results are saved as JSON
+and can be compared with a previous run.
+
+Run from the repository root with `python -m benchmarks.bench_scrapers [options]`, see `--help`.
+"""
+
+ENGINES: tuple[str, ...] = (
+    "sequential",
+    "concurrent",
+    "async",
+    "batch",
+    "batch_pack",
+    "batch_pipelined",
+)
+
+
+def urlopen_request(url: str) -> str:
+    return urlopen(url).read().decode("utf-8")
+
+
+def peak_rss() -> int | NoneType:
+    """
+    Peak resident set size of this process.
+
+    Returns:
+        int | NoneType: bytes, or None where the `resource` module is not available (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def disk_bytes(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def run_engine(
+    engine: str, urls: list[str], request: str, workers: int, scheduler: bool = False
+) -> dict[str, Any]:
+    """
+    Scrape `urls` with one engine. Runs inside a fresh process, so peak RSS is the engine's own.
+
+    Args:
+        engine (str): one of `ENGINES`.
+        urls (list[str]): urls to scrape.
+        request (str): request function, "keep_alive" or "urlopen".
+        workers (int): threads or concurrent requests of the parallel engines.
+        scheduler (bool, optional): whether to request through a `RequestScheduler`. Defaults to False.
+
+    Returns:
+        dict[str, Any]: benchmark results.
+    """
+    request_func: Callable[[str], str] = (
+        keep_alive_request_func() if request == "keep_alive" else urlopen_request
+    )
+    scheduled: RequestScheduler | NoneType = (
+        RequestScheduler(request_func, max_retries=8, backoff=0.05, max_concurrency=workers)
+        if scheduler
+        else None
+    )
+
+    if scheduled is not None:
+        request_func = scheduled.request
+    metrics: Metrics = Metrics()
+
+    with tempfile.TemporaryDirectory() as path:
+        start: float = time.perf_counter()
+
+        if engine == "sequential":
+            scraper = SequentialScraper(urls, request_func, extract_emails, metrics=metrics)
+            results: list[Any] = [result for _, _, result in scraper.iter_results()]
+        elif engine == "concurrent":
+            scraper = ConcurrentScraper(
+                urls, request_func, extract_emails, max_workers=workers, metrics=metrics
+            )
+            results = scraper.run()
+        elif engine == "async":
+            scraper = AsyncScraper(
+                urls, request_func, extract_emails, limit=workers, metrics=metrics
+            )
+            results = scraper.run()
+        elif engine.startswith("batch"):
+            scraper = BatchScraper(
+                urls,
+                request_func,
+                extract_emails,
+                path,
+                metrics=metrics,
+                store=PackStore(path) if engine == "batch_pack" else None,
+            )
+            results = scraper.run(
+                delete_after_use=False,
+                pipelined=engine == "batch_pipelined",
+                workers=workers,
+            )
+        else:
+            raise ValueError(f"Expected `engine` in {ENGINES}, got: '{engine}'.")
+
+        elapsed: float = time.perf_counter() - start
+        written: int = disk_bytes(Path(path))
+
+    summary: dict[str, Any] = metrics.summary()
+
+    return {
+        "urls": len(urls),
+        "seconds": elapsed,
+        "urls_per_second": len(urls) / elapsed,
+        "peak_rss": peak_rss(),
+        "disk_bytes": written,
+        "parse_seconds": summary["scrape_seconds"],
+        "request_latency": summary["request_latency"],
+        "bytes_received": summary["bytes"],
+        "emails": sum(len(result) for result in results if result),
+        "retries": scheduled.retries if scheduled is not None else None,
+        "throttled_seconds": scheduled.throttled if scheduled is not None else None,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--urls", type=int, default=500, help="number of queries")
+    parser.add_argument("--latency", type=float, default=0.01, help="server latency in seconds")
+    parser.add_argument("--page-size", type=int, default=20_000, help="minimum page size in bytes")
+    parser.add_argument("--page-cap", type=int, default=10, help="results per page")
+    parser.add_argument("--people", type=int, default=20_000, help="size of the fake population")
+    parser.add_argument("--workers", type=int, default=8, help="parallelism of the parallel engines")
+    parser.add_argument("--request", choices=("keep_alive", "urlopen"), default="keep_alive")
+    parser.add_argument("--scheduler", action="store_true", help="request through a RequestScheduler")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failed with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of requests throttled with 429")
+    parser.add_argument("--max-rate", type=float, help="requests per second above which the server throttles")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds of a 429")
+    parser.add_argument("--output", type=Path, default=Path("bench_scrapers.json"))
+    parser.add_argument("--compare", type=Path, help="previous results to compare with")
+
+    args: argparse.Namespace = parser.parse_args()
+
+    # without retries the first failed request ends the sequential and batch runs
+    if (args.error_rate or args.throttle_rate or args.max_rate) and not args.scheduler:
+        parser.error("--error-rate, --throttle-rate and --max-rate need --scheduler")
+
+    return args
+
+
+if __name__ == "__main__":
+    args: argparse.Namespace = parse_args()
+
+    with FakeDirectory(
+        latency=args.latency,
+        page_size=args.page_size,
+        page_cap=args.page_cap,
+        people=args.people,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rate=args.max_rate,
+        retry_after=args.retry_after,
+    ) as directory:
+        # prefixes of names in the population, so pages have results to parse
+        urls: list[str] = [
+            directory.rewrite(url)
+            for url in islice(
+                generate_query_urls(f"{prefix}*" for prefix in directory.prefixes(3)),
+                args.urls,
+            )
+        ]
+
+        results: dict[str, dict[str, Any]] = {}
+
+        for engine in args.engines:
+            # a fresh process per engine, started with spawn so it does not inherit this one's memory
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+                results[engine] = executor.submit(
+                    run_engine, engine, urls, args.request, args.workers, args.scheduler
+                ).result()
+
+        served_errors: int = directory.errors
+
+    previous: dict[str, Any] = (
+        json.loads(args.compare.read_text())["results"] if args.compare else {}
+    )
+
+    print(
+        f"{'engine'.ljust(16)} {'urls/s':>8} {'rss MB':>8} {'disk MB':>8} {'parse s':>8}"
+        f" {'emails':>8} {'retries':>8}"
+    )
+
+    for engine, result in results.items():
+        rss: str = f"{result['peak_rss'] / 1e6:8.1f}" if result["peak_rss"] else f"{'-':>8}"
+        line: str = (
+            f"{engine.ljust(16)} {result['urls_per_second']:8.1f} {rss}"
+            f" {result['disk_bytes'] / 1e6:8.2f} {result['parse_seconds']:8.3f}"
+            f" {result['emails']:8d} {result['retries'] if args.scheduler else '-':>8}"
+        )
+
+        if engine in previous:
+            line += f"  {result['urls_per_second'] / previous[engine]['urls_per_second']:6.2f}x"
+
+        print(line)
+
+    args.output.write_text(
+        json.dumps(
+            {
+                "time": time.time(),
+                "config": {
+                    name: str(value) if isinstance(value, Path) else value
+                    for name, value in vars(args).items()
+                },
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    if args.scheduler:
+        print(f"Server answered {served_errors} requests with 503 or 429")
+
+    print(f"Saved to {args.output}")
@@ -0,0 +1,41 @@
+from timeit import timeit
+from types import NoneType
+from validate import compile_validator, set_validation, validate
+
+"""
+Microbenchmark of `validate` against compiled validators on the checks made by `Logger.log`.
+
+Run from the repository root with `python -m benchmarks.bench_validate`.
+"""
+
+NUMBER: int = 100_000
+
+validate_str = compile_validator(str, "msg")
+validate_optional_str = compile_validator((str, NoneType), "source")
+
+
+def run_validate() -> None:
+    validate("msg", str)
+    validate(None, (str, NoneType))
+
+
+def run_compiled() -> None:
+    validate_str("msg")
+    validate_optional_str(None)
+
+
+if __name__ == "__main__":
+    results: dict[str, float] = {
+        "validate": timeit(run_validate, number=NUMBER),
+        "compiled": timeit(run_compiled, number=NUMBER),
+    }
+
+    set_validation(False)
+    results["disabled"] = timeit(run_compiled, number=NUMBER)
+    set_validation(True)
+
+    for name, seconds in results.items():
+        print(
+            f"{name.ljust(10)} {seconds / NUMBER * 1e9:10.1f} ns/run"
+            f"  {results['validate'] / seconds:7.1f}x"
+        )
@@ -0,0 +1,393 @@
+import bisect
+import gzip
+import random
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from types import NoneType
+from typing import Any, Iterable
+from urllib.parse import parse_qs, urlsplit
+
+"""
+Local stand-in for the `/directory/lookup` page of the CWRU directory, used by the benchmarks.
+
+Serves synthetic result pages for `prefix*` wildcard, surname, given name and phonetic queries over a
+seeded random population, with configurable latency, page size and result cap. A few names are spelled
+with an apostrophe, which `prefix*` queries over the alphabet never match. It can also fail a share of
+requests with 503, or throttle them with 429 and `Retry-After`, to exercise `RequestScheduler`. Run it on
+its own with `python -m benchmarks.fake_directory [port]`.
+"""
+
+_SYLLABLES: tuple[str, ...] = (
+    "al", "an", "ar", "ba", "be", "bo", "ca", "ch", "da", "de", "el", "en", "fa", "ga", "ha",
+    "he", "is", "ja", "jo", "ka", "ki", "la", "le", "li", "lo", "ma", "me", "mi", "na", "ne",
+    "ni", "no", "ol", "pa", "ra", "re", "ri", "ro", "sa", "se", "sh", "ta", "te", "th", "to",
+    "va", "vi", "wa", "ya", "yo", "za", "zh", "qu", "xi", "us", "or", "um", "ez", "ic", "ok",
+)
+_CATEGORIES: tuple[str, ...] = ("student", "faculty", "staff", "emeriti")
+_DEPARTMENTS: tuple[str, ...] = (
+    "Computer Science", "Mathematics", "Biology", "Physics", "Chemistry", "Nursing", "Law",
+)
+
+
+class FakeDirectory:
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.__server.server_port}"
+
+    @url.setter
+    def url(self, url: str) -> None:
+        raise AttributeError("Cannot set `url`.")
+
+    @url.deleter
+    def url(self) -> None:
+        raise AttributeError("Cannot delete `url`.")
+
+    @property
+    def requests(self) -> int:
+        return self.__requests
+
+    @requests.setter
+    def requests(self, requests: int) -> None:
+        raise AttributeError("Cannot set `requests`.")
+
+    @requests.deleter
+    def requests(self) -> None:
+        raise AttributeError("Cannot delete `requests`.")
+
+    @property
+    def errors(self) -> int:
+        return self.__errors
+
+    @errors.setter
+    def errors(self, errors: int) -> None:
+        raise AttributeError("Cannot set `errors`.")
+
+    @errors.deleter
+    def errors(self) -> None:
+        raise AttributeError("Cannot delete `errors`.")
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        page_size: int = 20_000,
+        page_cap: int = 10,
+        people: int = 20_000,
+        seed: int = 0,
+        port: int = 0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_rate: float | NoneType = None,
+        retry_after: float = 1.0,
+    ) -> None:
+        """
+        Fake directory server, started on `start` or when entering a `with` block.
+
+        Args:
+            latency (float, optional): seconds every request waits before responding. Defaults to 0.0.
+            page_size (int, optional): minimum page size in bytes, pages are padded up to it. Defaults to 20_000.
+            page_cap (int, optional): maximum results per page. Defaults to 10.
+            people (int, optional): size of the synthetic population. Defaults to 20_000.
+            seed (int, optional): population seed. Defaults to 0.
+            port (int, optional): port to listen on. Defaults to 0, meaning any free port.
+            error_rate (float, optional): share of requests answered with 503. Defaults to 0.0.
+            throttle_rate (float, optional): share of requests answered with 429. Defaults to 0.0.
+            max_rate (float | NoneType, optional): requests per second above which requests are answered with
+                429. Defaults to None, meaning no limit.
+            retry_after (float, optional): seconds sent in the `Retry-After` header of a 429. Defaults to 1.0.
+        """
+        self.latency: float = latency
+        self.page_size: int = page_size
+        self.page_cap: int = page_cap
+        self.error_rate: float = error_rate
+        self.throttle_rate: float = throttle_rate
+        self.max_rate: float | NoneType = max_rate
+        self.retry_after: float = retry_after
+
+        rng: random.Random = random.Random(seed)
+        self.__people: list[tuple[str, str, str, str, str]] = []
+        keys: list[tuple[str, int]] = []
+
+        for n in range(people):
+            given: str = "".join(rng.choices(_SYLLABLES, k=rng.randint(2, 4)))
+            surname: str = "".join(rng.choices(_SYLLABLES, k=rng.randint(2, 4)))
+
+            if rng.random() < 0.02:
+                surname = f"{surname[0]}'{surname[1:]}"
+            email: str = f"{given[0]}{surname[:2].strip(chr(39))}{n}@case.edu"
+
+            self.__people.append(
+                (
+                    given.capitalize(),
+                    surname.capitalize(),
+                    email,
+                    rng.choice(_CATEGORIES),
+                    rng.choice(_DEPARTMENTS),
+                )
+            )
+            keys += [(given, n), (surname, n)]
+
+        # sorted names, so a prefix query is a binary search
+        keys.sort()
+        self.__keys: list[str] = [key for key, _ in keys]
+        self.__ids: list[int] = [n for _, n in keys]
+
+        self.__requests: int = 0
+        self.__errors: int = 0
+        self.__recent: deque[float] = deque()
+        self.__rng: random.Random = random.Random(seed)
+        self.__lock: Lock = Lock()
+        self.__server: ThreadingHTTPServer = ThreadingHTTPServer(
+            ("127.0.0.1", port), self.__handler()
+        )
+        self.__server.daemon_threads = True
+        self.__thread: Thread | NoneType = None
+
+    def __enter__(self) -> "FakeDirectory":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def rewrite(self, url: str) -> str:
+        """
+        Point a directory url, e.g. from `generate_query_url`, at this server.
+
+        Args:
+            url (str): directory url.
+
+        Returns:
+            str: url on this server.
+        """
+        parts = urlsplit(url)
+
+        return f"{self.url}{parts.path}?{parts.query}"
+
+    def prefixes(self, length: int) -> list[str]:
+        """
+        Name prefixes that match someone in the population, e.g. for `prefix*` queries with results.
+
+        Args:
+            length (int): prefix length.
+
+        Returns:
+            list[str]: sorted lowercase prefixes.
+        """
+        return sorted(
+            {key[:length] for key in self.__keys if len(key) >= length and key[:length].isalpha()}
+        )
+
+    def search(
+        self,
+        search_text: str = "",
+        category: str = "all",
+        surname: str = "",
+        given_name: str = "",
+        search_method: str = "regular",
+    ) -> list[tuple[str, str, str, str, str]]:
+        """
+        Find the people matching a query, as the page for it would list them.
+
+        Args:
+            search_text (str, optional): query text, `prefix*` matches given names and surnames starting with
+                `prefix`. Defaults to "".
+            category (str, optional): search category. Defaults to "all".
+            surname (str, optional): surname, exact or `prefix*`. Defaults to "".
+            given_name (str, optional): given name, exact or `prefix*`. Defaults to "".
+            search_method (str, optional): "regular", or "phonetic" to match names with the same letters
+                as `search_text`, ignoring punctuation. Defaults to "regular".
+
+        Returns:
+            list[tuple[str, str, str, str, str]]: given name, surname, email, category and department.
+        """
+
+        def letters(name: str) -> str:
+            return "".join(c for c in name.lower() if c.isalpha())
+
+        def matches(name: str, pattern: str) -> bool:
+            if pattern.endswith("*"):
+                return name.lower().startswith(pattern[:-1].lower())
+
+            return name.lower() == pattern.lower()
+
+        prefix: str = search_text.lower().rstrip("*")
+
+        if search_method == "phonetic":
+            ids: Iterable[int] = (
+                n
+                for n, person in enumerate(self.__people)
+                if prefix and letters(prefix) in (letters(person[0]), letters(person[1]))
+            )
+        elif prefix:
+            start: int = bisect.bisect_left(self.__keys, prefix)
+            stop: int = bisect.bisect_left(self.__keys, prefix + "\uffff")
+            ids = sorted(set(self.__ids[start:stop]))
+        elif surname or given_name:
+            ids = range(len(self.__people))
+        else:
+            return []
+
+        return [
+            person
+            for person in (self.__people[n] for n in ids)
+            if (category == "all" or person[3] == category)
+            and (not surname or matches(person[1], surname))
+            and (not given_name or matches(person[0], given_name))
+        ]
+
+    def page(self, **query: str) -> str:
+        """
+        Render the result page of a query.
+
+        Args:
+            **query (str): query, see `search`.
+
+        Returns:
+            str: html.
+        """
+        people = self.search(**query)
+        rows: str = "".join(
+            f"<tr><td>{given} {surname}</td><td><a href=\"mailto:{email}\">{email}</a></td>"
+            f"<td>{category.capitalize()}</td><td>{department}</td></tr>"
+            for given, surname, email, category, department in people[: self.page_cap]
+        )
+        notice: str = (
+            "<p>More results found, <a href=\"/login\">Log in</a> to see them.</p>"
+            if len(people) > self.page_cap
+            else ""
+        )
+        html: str = (
+            "<html><head><title>Directory Lookup</title></head><body>"
+            f"<table>{rows}</table>{notice}"
+        )
+        padding: int = max(self.page_size - len(html) - len("</body></html>") - 7, 0)
+
+        return html + f"<!--{'x' * padding}-->" + "</body></html>"
+
+    def _respond(self, target: str, accept_encoding: str) -> tuple[int, dict[str, str], bytes]:
+        """
+        Respond to a GET request.
+
+        Args:
+            target (str): request path and query.
+            accept_encoding (str): `Accept-Encoding` header of the request.
+
+        Returns:
+            tuple[int, dict[str, str], bytes]: status, headers and body.
+        """
+        with self.__lock:
+            self.__requests += 1
+            now: float = time.monotonic()
+            draw: float = self.__rng.random()
+
+            # requests of the last second, for `max_rate`
+            self.__recent.append(now)
+
+            while self.__recent[0] <= now - 1:
+                self.__recent.popleft()
+
+            if draw < self.error_rate:
+                status: int = 503
+            elif draw < self.error_rate + self.throttle_rate or (
+                self.max_rate is not None and len(self.__recent) > self.max_rate
+            ):
+                status = 429
+            else:
+                status = 200
+
+            self.__errors += status != 200
+
+        if status == 503:
+            return 503, {}, b"Service Unavailable"
+
+        if status == 429:
+            return 429, {"Retry-After": f"{self.retry_after:g}"}, b"Too Many Requests"
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        parts = urlsplit(target)
+
+        if parts.path != "/directory/lookup":
+            return 404, {}, b""
+
+        query: dict[str, list[str]] = parse_qs(parts.query)
+        body: bytes = self.page(
+            **{
+                name: query.get(parameter, [default])[0]
+                for name, parameter, default in (
+                    ("search_text", "search_text", ""),
+                    ("category", "category", "all"),
+                    ("surname", "surname", ""),
+                    ("given_name", "givenname", ""),
+                    ("search_method", "search_method", "regular"),
+                )
+            }
+        ).encode("utf-8")
+        headers: dict[str, str] = {"Content-Type": "text/html; charset=utf-8"}
+
+        if "gzip" in accept_encoding:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        return 200, headers, body
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+        directory: FakeDirectory = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version: str = "HTTP/1.1"
+            disable_nagle_algorithm: bool = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                status, headers, body = directory._respond(
+                    self.path, self.headers.get("Accept-Encoding", "")
+                )
+
+                self.send_response(status)
+
+                for name, value in {**headers, "Content-Length": str(len(body))}.items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> None:
+        """
+        Serve requests on a background thread.
+        """
+        if self.__thread is None:
+            self.__thread = Thread(target=self.__server.serve_forever, daemon=True)
+            self.__thread.start()
+
+    def close(self) -> None:
+        """
+        Stop the server.
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+
+        self.__server.server_close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    directory: FakeDirectory = FakeDirectory(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8080)
+    print(f"Serving on {directory.url}/directory/lookup")
+    directory.start()
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        directory.close()
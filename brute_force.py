@@ -1,9 +1,11 @@
-from itertools import product
-import re
-from urllib.request import urlopen
-from cwru.cwru import generate_query_url
+import os
+from pathlib import Path
+from cwru import keep_alive_request_func
+from cwru.cwru import generate_prefix_urls
+from cwru.parser import extract_emails
 from log import Logger
-from scraper import SequentialScraper
+from scraper import RequestScheduler, SequentialScraper
+from sink import DedupSink, ResultStore, SweepState
 
 """
 This module mainly tries to collect all student emails from the university
@@ -23,31 +25,58 @@ General Notes
 - This approach of brute forcing names will not match all possible names, but it
   gets close enough to be useful.
   - Some names that will not be matched: R'Ay, etc.
+  - This script only sweeps fixed prefixes. `cwru.SweepPlanner` plans surname, given name
+    and phonetic queries that cover such names, but it is not used here.
 
 """
 
-logger: Logger = Logger(print_=True, file_=True, file_path="brute_force_log.rlog")
+logger: Logger = Logger(
+    print_=True, file_=True, file_path="brute_force_log.rlog", buffered=True
+)
+
+# results of previous runs, unseen, high churn and stale prefixes are queried first.
+# Set CWRU_REFRESH to only refresh that many prefixes, the others keep their previous results.
+state: SweepState = SweepState("brute_force.state")
+refresh: int | None = int(os.getenv("CWRU_REFRESH", "0")) or None
 
-urls: list[str] = [
-    generate_query_url(seach_text=query, category="student")
-    for query in [
-        f"{''.join(c)}*" for c in product("abcdefghijklmnopqrstuvwxyz", repeat=3)
-    ]
-]
+urls: list[str] = state.order(generate_prefix_urls(3, category="student"), limit=refresh)
+total: int = len(urls)
 
 scraper: SequentialScraper = SequentialScraper(
     url=urls,
-    request_func=lambda url: urlopen(url).read().decode("utf-8"),
-    scrape_func=lambda html: list(set(re.findall("[\w\.-]+@case.edu+", html))),
+    # retry throttled or failed requests with backoff instead of stopping the run
+    request_func=RequestScheduler(
+        # reuse one keep-alive connection instead of a new TLS handshake per query
+        keep_alive_request_func(), rate=10.0, max_retries=5
+    ).request,
+    scrape_func=extract_emails,
+    # resume an interrupted run
+    journal="brute_force.journal",
 )
 
-results: list[list[str]] = scraper.run(
-    callback=lambda i, url: logger.log(f"Scraping {i} of {len(urls)}: {url}")
-)
+# count new and duplicate emails as each page is scraped, every person matches many overlapping prefixes,
+# and keep every email with the query that found it in an indexed store
+with DedupSink() as sink, ResultStore("brute_force_results.db") as store:
+    for i, url, emails in store.consume(
+        scraper.iter_results(
+            callback=lambda i, url: logger.log(f"Scraping {i} of {total}: {url}")
+        )
+    ):
+        # the state keeps every email of the page, not only the ones new to the run
+        state.feed(url, emails or [])
+        sink.feed(url, emails or [])
+
+        new, duplicates = sink.queries[url]
+        logger.log(f"Scraped {i} of {total}: {new} new, {duplicates} duplicate emails")
+
+    logger.log(f"Found {sink.new} unique emails, {sink.duplicates} duplicates")
 
-# flatten the results
-results: list[str] = [r for r in results for r in r]
+    # write only the emails added and removed since the previous run, drop removed ones from the store
+    changed: int = state.changed
+    store.remove(state.delta()[1])
+    added, removed = state.commit("brute_force_delta.dump")
+    logger.log(f"{changed} of {total} queries changed: {added} added, {removed} removed emails")
 
-# write the results to a file
-with open("brute_force_results.dump", "w") as f:
-    f.write("\n".join(results))
\ No newline at end of file
+# the run is complete, the next one starts from the saved state
+scraper.journal.close()
+Path("brute_force.journal").unlink()
@@ -1 +1,4 @@
-from cwru.cwru import generate_query_url
\ No newline at end of file
+from cwru.cwru import generate_prefix_urls, generate_query_url, generate_query_urls
+from cwru.planner import PrefixPlanner
+from cwru.sweep import SweepPlanner
+from cwru.fetch import keep_alive_request_func
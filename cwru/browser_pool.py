@@ -0,0 +1,235 @@
+import atexit
+from contextlib import contextmanager
+from queue import Empty, Queue
+from threading import Lock
+from types import NoneType
+from typing import Any, Callable, Iterator
+from validate import validate
+
+# put in the idle queue when a driver is quit, so a thread waiting for a driver starts a new one
+_FREED: object = object()
+
+
+def driver_healthy(driver: Any) -> bool:
+    """
+    Check if a WebDriver still responds.
+
+    Args:
+        driver (Any): WebDriver.
+
+    Returns:
+        bool: Whether the driver responds.
+    """
+    try:
+        driver.current_url
+    except Exception:
+        return False
+
+    return True
+
+
+class BrowserPool:
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @size.setter
+    def size(self, size: int) -> None:
+        raise AttributeError("Cannot set `size`.")
+
+    @size.deleter
+    def size(self) -> None:
+        raise AttributeError("Cannot delete `size`.")
+
+    @property
+    def started(self) -> int:
+        return self.__started
+
+    @started.setter
+    def started(self, started: int) -> None:
+        raise AttributeError("Cannot set `started`.")
+
+    @started.deleter
+    def started(self) -> None:
+        raise AttributeError("Cannot delete `started`.")
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 4,
+        max_pages: int | NoneType = 100,
+        setup: Callable[[Any], Any] | NoneType = None,
+        health_check: Callable[[Any], bool] = driver_healthy,
+    ) -> None:
+        """
+        Pool of long-lived WebDriver instances.
+
+        Drivers are started lazily, up to `size` of them, and set up once (e.g. logged in) with `setup`.
+        A driver is checked with `health_check` before every lease and after a lease that raised, and is
+        replaced when unhealthy or after it loaded `max_pages` pages to limit browser memory growth.
+        Every driver is quit on `close`, when leaving a `with` block and at exit.
+
+        Args:
+            factory (Callable[[], Any]): function starting a new driver.
+            size (int, optional): maximum number of drivers. Defaults to 4.
+            max_pages (int | NoneType, optional): pages a driver loads before it is replaced.
+                Defaults to 100, None means never.
+            setup (Callable[[Any], Any] | NoneType, optional): called with every new driver. Defaults to None.
+            health_check (Callable[[Any], bool], optional): check if a driver is usable. Defaults to `driver_healthy`.
+        """
+        validate(factory, Callable)
+        validate(size, int)
+        validate(max_pages, (int, NoneType))
+        validate(setup, (Callable, NoneType))
+        validate(health_check, Callable)
+
+        if size < 1:
+            raise ValueError(f"Expected `size` >= 1, got: '{size}'.")
+
+        self.__factory: Callable[[], Any] = factory
+        self.__size: int = size
+        self.__max_pages: int | NoneType = max_pages
+        self.__setup: Callable[[Any], Any] | NoneType = setup
+        self.__health_check: Callable[[Any], bool] = health_check
+
+        self.__idle: Queue[tuple[Any, int]] = Queue()
+        self.__live: int = 0
+        self.__started: int = 0
+        self.__closed: bool = False
+        self.__lock: Lock = Lock()
+
+        atexit.register(self.close)
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __start(self) -> tuple[Any, int]:
+        try:
+            driver: Any = self.__factory()
+        except Exception:
+            with self.__lock:
+                self.__live -= 1
+
+            raise
+
+        try:
+            if self.__setup is not None:
+                self.__setup(driver)
+        except Exception:
+            self.__quit(driver)
+            raise
+
+        with self.__lock:
+            self.__started += 1
+
+        return driver, 0
+
+    def __quit(self, driver: Any) -> None:
+        with self.__lock:
+            self.__live -= 1
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def __acquire(self) -> tuple[Any, int]:
+        while True:
+            if self.__closed:
+                raise ValueError("Cannot lease a driver from a closed pool.")
+
+            try:
+                driver, pages = self.__idle.get_nowait()
+            except Empty:
+                with self.__lock:
+                    start: bool = self.__live < self.__size
+
+                    if start:
+                        self.__live += 1
+
+                if start:
+                    return self.__start()
+
+                driver, pages = self.__idle.get()
+
+            # `close` puts back an empty entry to stop the wait, pass it on to the next waiter
+            if driver is None:
+                self.__idle.put((None, 0))
+                continue
+
+            if driver is _FREED:
+                continue
+
+            if self.__health_check(driver):
+                return driver, pages
+
+            self.__quit(driver)
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """
+        Lease a driver for loading one page.
+
+        Yields:
+            Iterator[Any]: WebDriver.
+        """
+        driver, pages = self.__acquire()
+        healthy: bool = True
+
+        try:
+            yield driver
+        except Exception:
+            healthy = self.__health_check(driver)
+            raise
+        finally:
+            pages += 1
+
+            recycle: bool = (
+                not healthy
+                or self.__closed
+                or (self.__max_pages is not None and pages >= self.__max_pages)
+            )
+
+            if recycle:
+                self.__quit(driver)
+                self.__idle.put((_FREED, 0))
+            else:
+                self.__idle.put((driver, pages))
+
+    def request(self, url: str) -> str:
+        """
+        Load `url` in a leased driver. Can be used as the `request_func` of any scraper.
+
+        Args:
+            url (str): url to load.
+
+        Returns:
+            str: html source.
+        """
+        with self.lease() as driver:
+            driver.get(url)
+
+            return driver.page_source
+
+    def close(self) -> None:
+        """
+        Quit every idle driver, leased drivers are quit when they are returned.
+        """
+        self.__closed = True
+
+        while True:
+            try:
+                driver, _ = self.__idle.get_nowait()
+            except Empty:
+                break
+
+            if driver is not None and driver is not _FREED:
+                self.__quit(driver)
+
+        # wake up threads waiting for a driver
+        self.__idle.put((None, 0))
+
+        atexit.unregister(self.close)
@@ -0,0 +1,159 @@
+from http.client import (
+    HTTPConnection,
+    HTTPException,
+    HTTPResponse,
+    HTTPSConnection,
+    ImproperConnectionState,
+    RemoteDisconnected,
+)
+from threading import Lock, local
+from types import NoneType
+from urllib.parse import urlsplit
+from validate import validate
+
+# errors of a request on a reused keep-alive connection the server already closed
+_DROPPED: tuple[type[OSError], ...] = (RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ConnectionPool:
+    @property
+    def timeout(self) -> float:
+        return self.__timeout
+
+    @timeout.setter
+    def timeout(self, timeout: int | float) -> None:
+        validate(timeout, (int, float))
+
+        self.__timeout = timeout
+
+    @timeout.deleter
+    def timeout(self) -> None:
+        raise AttributeError("Cannot delete `timeout`.")
+
+    def __init__(
+        self, timeout: int | float = 30.0, headers: dict[str, str] | NoneType = None
+    ) -> None:
+        """
+        Pool of persistent keep-alive HTTP connections.
+
+        Every thread keeps one connection per host, so a scraper running on any number of threads
+        reuses its connections instead of opening a new TCP and TLS connection per request.
+
+        Args:
+            timeout (int | float, optional): socket timeout in seconds. Defaults to 30.0.
+            headers (dict[str, str] | NoneType, optional): headers sent with every request. Defaults to None.
+        """
+        validate(headers, (dict, NoneType))
+
+        self.__timeout: float = 30.0
+        self.__headers: dict[str, str] = dict(headers or {})
+        self.__local: local = local()
+        self.__connections: list[HTTPConnection] = []
+        self.__lock: Lock = Lock()
+
+        self.timeout = timeout
+
+    def __connection(self, scheme: str, host: str) -> HTTPConnection:
+        connections: dict[tuple[str, str], HTTPConnection] | NoneType = getattr(
+            self.__local, "connections", None
+        )
+
+        if connections is None:
+            connections = self.__local.connections = {}
+
+        if (scheme, host) not in connections:
+            if scheme == "https":
+                connection: HTTPConnection = HTTPSConnection(host, timeout=self.timeout)
+            elif scheme == "http":
+                connection = HTTPConnection(host, timeout=self.timeout)
+            else:
+                raise ValueError(f"Expected 'http' or 'https' url, got: '{scheme}'.")
+
+            connections[(scheme, host)] = connection
+
+            with self.__lock:
+                self.__connections.append(connection)
+
+        return connections[(scheme, host)]
+
+    def __send(
+        self, connection: HTTPConnection, target: str, headers: dict[str, str] | NoneType
+    ) -> HTTPResponse:
+        try:
+            connection.request(
+                "GET", target, headers={**self.__headers, **(headers or {})}
+            )
+
+            return connection.getresponse()
+        except (OSError, HTTPException):
+            # a half sent request or unparsable response leaves the connection unusable
+            connection.close()
+            raise
+
+    def open(self, url: str, headers: dict[str, str] | NoneType = None) -> HTTPResponse:
+        """
+        Send a GET request for `url` over a pooled connection, without reading the body.
+
+        The body must be read completely before the calling thread sends another request to the same host,
+        if reading it fails the connection must be closed with `discard`. A request on a reused connection
+        the server already closed, or on a connection left in a broken state, is retried once on a new
+        connection, other errors such as timeouts are raised.
+
+        Args:
+            url (str): url to request.
+            headers (dict[str, str] | NoneType, optional): extra headers for this request. Defaults to None.
+
+        Returns:
+            HTTPResponse: response, with the body still to be read.
+        """
+        validate(url, str)
+
+        parts = urlsplit(url)
+        target: str = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        connection: HTTPConnection = self.__connection(parts.scheme, parts.netloc)
+
+        # a connection with an open socket was used by an earlier request
+        reused: bool = connection.sock is not None
+
+        try:
+            return self.__send(connection, target, headers)
+        except ImproperConnectionState:
+            # a response was left unread, `__send` closed the connection, reconnect once
+            return self.__send(connection, target, headers)
+        except _DROPPED:
+            if not reused:
+                raise
+
+            # the server closed an idle keep-alive connection, reconnect once
+            return self.__send(connection, target, headers)
+
+    def discard(self, url: str) -> None:
+        """
+        Close the calling thread's connection to the host of `url`, e.g. after reading a response body
+        failed part way. The next request to the host opens a new connection.
+
+        Args:
+            url (str): url on the host.
+        """
+        validate(url, str)
+
+        parts = urlsplit(url)
+        connections: dict[tuple[str, str], HTTPConnection] = getattr(
+            self.__local, "connections", {}
+        )
+        connection: HTTPConnection | NoneType = connections.get(
+            (parts.scheme, parts.netloc)
+        )
+
+        if connection is not None:
+            connection.close()
+
+    def close(self) -> None:
+        """
+        Close every pooled connection.
+        """
+        with self.__lock:
+            for connection in self.__connections:
+                connection.close()
+
+            self.__connections = []
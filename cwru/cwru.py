@@ -1,8 +1,21 @@
 from validate import validate
-from validate.vval import validate_option
+from validate.vval import compile_validator, validate_option
 
+from itertools import product
+from typing import Iterable, Iterator
 from urllib.parse import quote
 
+# search options accepted by the directory
+CATEGORIES: list[str] = ["all", "faculty", "staff", "student", "emeriti"]
+SEARCH_METHODS: list[str] = ["regular", "phonetic"]
+
+_URL: str = "https://webapps.case.edu/directory/lookup?"
+
+# compiled once, `generate_query_url` is called for every query
+_validate_seach_text = compile_validator(str, "seach_text")
+_validate_surname = compile_validator(str, "surname")
+_validate_given_name = compile_validator(str, "given_name")
+
 
 def generate_query_url(
     seach_text: str = "",
@@ -36,17 +49,15 @@ def generate_query_url(
     """
 
     # validate arguments
-    validate(seach_text, str)
+    _validate_seach_text(seach_text)
 
-    validate(surname, str)
+    _validate_surname(surname)
 
-    validate(given_name, str)
+    _validate_given_name(given_name)
 
-    categories: list[str] = ["all", "faculty", "staff", "student", "emeriti"]
-    validate_option(category, categories)
+    validate_option(category, CATEGORIES)
 
-    search_methods: list[str] = ["regular", "phonetic"]
-    validate_option(search_method, search_methods)
+    validate_option(search_method, SEARCH_METHODS)
 
     # url encode special characters
     seach_text = quote(seach_text)
@@ -54,8 +65,85 @@ def generate_query_url(
     given_name = quote(given_name)
 
     return (
-        "https://webapps.case.edu/directory/lookup?"
+        _URL
         + f"search_text={seach_text}&surname={surname}&givenname={given_name}"
         + f"&department=&location=&category={category}"
         + f"&search_method={search_method}"
     )
+
+
+def generate_query_urls(
+    seach_texts: Iterable[str],
+    category: str = "all",
+    search_method: str = "regular",
+) -> Iterator[str]:
+    """
+    Lazily generate query urls for many search texts, see `generate_query_url`.
+
+    `category` and `search_method` are validated once and the constant parts of the url are built once,
+    so every url costs one `quote` and one string concatenation. Yields the same urls as calling
+    `generate_query_url(seach_text=seach_text, category=category, search_method=search_method)` for
+    every search text.
+
+    Args:
+        seach_texts (Iterable[str]): Query texts.
+        category (str, optional): Search category, see `generate_query_url`. Defaults to "all".
+        search_method (str, optional): Search method, see `generate_query_url`. Defaults to "regular".
+
+    Yields:
+        Iterator[str]: Query urls.
+    """
+    validate_option(category, CATEGORIES)
+    validate_option(search_method, SEARCH_METHODS)
+
+    suffix: str = (
+        "&surname=&givenname=&department=&location="
+        + f"&category={category}&search_method={search_method}"
+    )
+
+    for seach_text in seach_texts:
+        _validate_seach_text(seach_text)
+
+        yield _URL + "search_text=" + quote(seach_text) + suffix
+
+
+def generate_prefix_urls(
+    length: int,
+    alphabet: str = "abcdefghijklmnopqrstuvwxyz",
+    category: str = "all",
+    search_method: str = "regular",
+    wildcard: bool = True,
+) -> Iterator[str]:
+    """
+    Lazily generate query urls for every prefix of `length` characters of `alphabet`, in `itertools.product`
+    order, e.g. "aa*", "ab*", ..., "zz*".
+
+    Replaces `[generate_query_url(seach_text=f"{''.join(c)}*") for c in product(alphabet, repeat=length)]`.
+    The alphabet and wildcard are url encoded once, so every url is a single string concatenation.
+
+    Args:
+        length (int): Prefix length.
+        alphabet (str, optional): Prefix characters. Defaults to "abcdefghijklmnopqrstuvwxyz".
+        category (str, optional): Search category, see `generate_query_url`. Defaults to "all".
+        search_method (str, optional): Search method, see `generate_query_url`. Defaults to "regular".
+        wildcard (bool, optional): Whether to end every prefix with the "*" wildcard. Defaults to True.
+
+    Yields:
+        Iterator[str]: Query urls.
+    """
+    validate(length, int)
+    validate(alphabet, str)
+    validate(wildcard, bool)
+    validate_option(category, CATEGORIES)
+    validate_option(search_method, SEARCH_METHODS)
+
+    prefix: str = _URL + "search_text="
+    suffix: str = (
+        (quote("*") if wildcard else "")
+        + "&surname=&givenname=&department=&location="
+        + f"&category={category}&search_method={search_method}"
+    )
+    characters: list[str] = [quote(c) for c in alphabet]
+
+    for c in product(characters, repeat=length):
+        yield prefix + "".join(c) + suffix
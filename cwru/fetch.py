@@ -0,0 +1,148 @@
+import codecs
+import re
+import zlib
+from functools import partial
+from http.client import HTTPResponse
+from types import NoneType
+from typing import Callable
+from urllib.error import HTTPError
+from urllib.parse import urljoin
+from cwru.connection import ConnectionPool
+from validate import validate
+
+# headers sent with every request of `keep_alive_request_func`
+DEFAULT_HEADERS: dict[str, str] = {"Accept-Encoding": "gzip, deflate"}
+
+_CHARSET: re.Pattern = re.compile(r"charset=([\w-]+)", re.IGNORECASE)
+_REDIRECTS: frozenset[int] = frozenset({301, 302, 303, 307, 308})
+
+
+def decode_response(response: HTTPResponse, chunk_size: int = 65536) -> str:
+    """
+    Read and decode the body of `response` while it streams in.
+
+    Gzip and deflate bodies are decompressed chunk by chunk and decoded with the charset of the
+    `Content-Type` header (utf-8 if it has none), so the compressed body is never held in memory whole.
+
+    Args:
+        response (HTTPResponse): response with the body still to be read.
+        chunk_size (int, optional): bytes read at a time. Defaults to 65536.
+
+    Returns:
+        str: decoded body.
+    """
+    encoding: str = (response.getheader("Content-Encoding") or "identity").lower()
+    charset: re.Match | NoneType = _CHARSET.search(
+        response.getheader("Content-Type") or ""
+    )
+
+    # wbits 32 + 15 detects both the gzip and zlib headers
+    decompressor: zlib._Decompress | NoneType = (
+        zlib.decompressobj(wbits=47)
+        if encoding in ("gzip", "x-gzip", "deflate")
+        else None
+    )
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+        charset.group(1) if charset else "utf-8"
+    )("replace")
+
+    parts: list[str] = []
+
+    while chunk := response.read(chunk_size):
+        if decompressor is not None:
+            chunk = decompressor.decompress(chunk)
+
+        parts.append(decoder.decode(chunk))
+
+    if decompressor is not None:
+        parts.append(decoder.decode(decompressor.flush()))
+
+    parts.append(decoder.decode(b"", final=True))
+
+    return "".join(parts)
+
+
+def read_response(response: HTTPResponse, pool: ConnectionPool, url: str) -> str:
+    """
+    Decode the body of a response from `pool.open`, closing the response and its connection if reading
+    fails (e.g. a timeout or a corrupt gzip stream) so the next request opens a new connection.
+
+    Args:
+        response (HTTPResponse): response with the body still to be read.
+        pool (ConnectionPool): connection pool the response came from.
+        url (str): requested url.
+
+    Returns:
+        str: decoded body.
+    """
+    try:
+        return decode_response(response)
+    except Exception:
+        response.close()
+        pool.discard(url)
+        raise
+
+
+def fetch(url: str, pool: ConnectionPool, max_redirects: int = 5) -> str:
+    """
+    Request `url` over a pooled keep-alive connection and decode the html, following redirects.
+
+    Args:
+        url (str): url to request.
+        pool (ConnectionPool): connection pool to request with.
+        max_redirects (int, optional): maximum number of redirects to follow. Defaults to 5.
+
+    Raises:
+        HTTPError: if the response status is 400 or above, like `urllib.request.urlopen`.
+
+    Returns:
+        str: html.
+    """
+    for _ in range(max_redirects + 1):
+        response: HTTPResponse = pool.open(url)
+        html: str = read_response(response, pool, url)
+
+        if response.status in _REDIRECTS and response.getheader("Location"):
+            url = urljoin(url, response.getheader("Location"))
+            continue
+
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.msg, None)
+
+        return html
+
+    raise HTTPError(url, response.status, "Too many redirects.", response.msg, None)
+
+
+def keep_alive_request_func(
+    pool: ConnectionPool | NoneType = None,
+    timeout: int | float = 30.0,
+    headers: dict[str, str] | NoneType = None,
+    max_redirects: int = 5,
+) -> Callable[[str], str]:
+    """
+    Create a `request_func` for any scraper, a drop-in replacement for `lambda url: urlopen(url).read().decode("utf-8")`.
+
+    Requests go over persistent keep-alive connections, one per host and thread, and ask for gzip bodies
+    which are decompressed and decoded while they stream in, so a query costs one round trip instead of a
+    new TCP and TLS handshake.
+
+    Args:
+        pool (ConnectionPool | NoneType, optional): connection pool to request with, `timeout` and `headers` are
+            ignored if given. Defaults to None, meaning a new pool.
+        timeout (int | float, optional): socket timeout in seconds. Defaults to 30.0.
+        headers (dict[str, str] | NoneType, optional): headers sent with every request, on top of
+            `DEFAULT_HEADERS`. Defaults to None.
+        max_redirects (int, optional): maximum number of redirects to follow. Defaults to 5.
+
+    Returns:
+        Callable[[str], str]: request function.
+    """
+    validate(pool, (ConnectionPool, NoneType))
+    validate(headers, (dict, NoneType))
+    validate(max_redirects, int)
+
+    if pool is None:
+        pool = ConnectionPool(timeout, {**DEFAULT_HEADERS, **(headers or {})})
+
+    return partial(fetch, pool=pool, max_redirects=max_redirects)
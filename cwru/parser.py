@@ -0,0 +1,172 @@
+import mmap
+import re
+from string import ascii_letters, digits
+from html import unescape
+from typing import Iterable, Iterator, NamedTuple
+from validate.vval import compile_validator
+
+# compiled once, parsers run on every scraped page
+_validate_html = compile_validator(str, "html")
+_validate_page = compile_validator((bytes, bytearray, memoryview, mmap.mmap), "page")
+
+_DOMAIN: str = "@case.edu"
+_WORD_CHARS: frozenset[str] = frozenset(ascii_letters + digits + "_")
+_LOCAL_CHARS: frozenset[str] = _WORD_CHARS | frozenset(".+-")
+
+_EMAIL: re.Pattern = re.compile(r"[\w.+-]+@case\.edu\b")
+_DOMAIN_BYTES: bytes = _DOMAIN.encode("ascii")
+_DOMAIN_BYTES_RE: re.Pattern = re.compile(re.escape(_DOMAIN_BYTES))
+_WORD_BYTES: frozenset[int] = frozenset(map(ord, _WORD_CHARS))
+_LOCAL_BYTES: frozenset[int] = frozenset(map(ord, _LOCAL_CHARS))
+_ROW: re.Pattern = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.IGNORECASE | re.DOTALL)
+_CELL: re.Pattern = re.compile(
+    r"<t[dh]\b[^>]*>(.*?)</t[dh]\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG: re.Pattern = re.compile(r"<[^>]*>")
+_SPACE: re.Pattern = re.compile(r"\s+")
+
+
+class DirectoryRecord(NamedTuple):
+    """
+    A person found in a directory result page.
+    """
+
+    name: str
+    email: str
+    category: str
+    department: str
+
+
+def extract_emails(html: str) -> list[str]:
+    """
+    Extract unique case.edu emails from a directory page, in page order.
+
+    Drop-in replacement for `lambda html: list(set(re.findall("[\\w\\.-]+@case.edu+", html)))`, which
+    also matched addresses like "x@caseXedu" and "x@case.eduu".
+
+    Args:
+        html (str): page html.
+
+    Returns:
+        list[str]: emails.
+    """
+    _validate_html(html)
+
+    emails: dict[str, None] = {}
+    find = html.find
+    length: int = len(html)
+
+    # find the domain with a plain substring search, then walk back over the local part,
+    # which is much cheaper than trying a regex match at every position of the page
+    end: int = find(_DOMAIN)
+
+    while end != -1:
+        stop: int = end + len(_DOMAIN)
+        start: int = end
+
+        while start > 0 and html[start - 1] in _LOCAL_CHARS:
+            start -= 1
+
+        if start < end and (stop == length or html[stop] not in _WORD_CHARS):
+            emails[html[start:stop]] = None
+
+        end = find(_DOMAIN, stop)
+
+    return list(emails)
+
+
+def extract_emails_bytes(page: bytes | bytearray | memoryview | mmap.mmap) -> list[str]:
+    """
+    Extract unique case.edu emails from the utf-8 encoded bytes of a directory page, in page order.
+
+    Runs over memory mapped pages without decoding or copying them, see `BatchScraper.batch_scrape`.
+
+    Args:
+        page (bytes | bytearray | memoryview | mmap.mmap): page bytes.
+
+    Returns:
+        list[str]: emails.
+    """
+    _validate_page(page)
+
+    emails: dict[bytes, None] = {}
+    length: int = len(page)
+
+    # same scan as `extract_emails`, memoryviews have no `find` so their domains are found with a regex
+    if isinstance(page, memoryview):
+        ends: Iterable[int] = [domain.start() for domain in _DOMAIN_BYTES_RE.finditer(page)]
+    else:
+        ends = __find_all(page)
+
+    for end in ends:
+        stop: int = end + len(_DOMAIN)
+        start: int = end
+
+        while start > 0 and page[start - 1] in _LOCAL_BYTES:
+            start -= 1
+
+        if start < end and (stop == length or page[stop] not in _WORD_BYTES):
+            emails[page[start:stop]] = None
+
+    # decode once per unique email, slices of memoryviews are views and are copied to bytes first
+    return list(dict.fromkeys(bytes(email).decode("ascii") for email in emails))
+
+
+def __find_all(page: bytes | bytearray | mmap.mmap) -> list[int]:
+    ends: list[int] = []
+    find = page.find
+    end: int = find(_DOMAIN_BYTES)
+
+    while end != -1:
+        ends.append(end)
+        end = find(_DOMAIN_BYTES, end + len(_DOMAIN))
+
+    return ends
+
+
+def __text(cell: str) -> str:
+    return _SPACE.sub(" ", unescape(_TAG.sub(" ", cell))).strip()
+
+
+def iter_records(html: str) -> Iterator[DirectoryRecord]:
+    """
+    Lazily parse the result rows of a directory page in a single pass.
+
+    Every table row with a case.edu email is a record. The first cell that does not hold the email is
+    the name, the next ones are the category and department, missing cells are empty strings.
+
+    Args:
+        html (str): page html.
+
+    Yields:
+        Iterator[DirectoryRecord]: records, in page order.
+    """
+    _validate_html(html)
+
+    for row in _ROW.finditer(html):
+        email: re.Match | None = _EMAIL.search(row.group(1))
+
+        if email is None:
+            continue
+
+        fields: list[str] = [
+            text
+            for text in (__text(cell) for cell in _CELL.findall(row.group(1)))
+            if text and email.group(0) not in text
+        ]
+        fields += [""] * (3 - len(fields))
+
+        yield DirectoryRecord(fields[0], email.group(0), fields[1], fields[2])
+
+
+def parse_records(html: str) -> list[DirectoryRecord]:
+    """
+    Parse the result rows of a directory page, see `iter_records`.
+
+    Args:
+        html (str): page html.
+
+    Returns:
+        list[DirectoryRecord]: unique records, in page order.
+    """
+    return list(dict.fromkeys(iter_records(html)))
@@ -0,0 +1,148 @@
+from itertools import product
+from types import NoneType
+from typing import Iterator
+from cwru.cwru import CATEGORIES, generate_query_urls
+from validate import validate
+from validate.vval import validate_option
+
+
+class PrefixPlanner:
+    @property
+    def requested(self) -> int:
+        return self.__requested
+
+    @requested.setter
+    def requested(self, requested: int) -> None:
+        raise AttributeError("Cannot set `requested`.")
+
+    @requested.deleter
+    def requested(self) -> None:
+        raise AttributeError("Cannot delete `requested`.")
+
+    @property
+    def expanded(self) -> int:
+        return self.__expanded
+
+    @expanded.setter
+    def expanded(self, expanded: int) -> None:
+        raise AttributeError("Cannot set `expanded`.")
+
+    @expanded.deleter
+    def expanded(self) -> None:
+        raise AttributeError("Cannot delete `expanded`.")
+
+    def __init__(
+        self,
+        page_cap: int = 10,
+        alphabet: str = "abcdefghijklmnopqrstuvwxyz",
+        start_length: int = 2,
+        max_length: int = 8,
+        category: str = "all",
+    ) -> None:
+        """
+        Adaptive prefix expansion query planner.
+
+        Instead of querying every prefix of a fixed length, starts from short `prefix*` wildcard queries
+        and only expands a prefix into its child prefixes (one more letter of `alphabet`) when its
+        response is truncated, i.e. it has `page_cap` results or says more results were found. Prefixes
+        are planned in rounds, one per prefix length.
+
+        Usage:
+            planner = PrefixPlanner(page_cap=10, category="student")
+            for urls in planner.rounds():
+                scraper = SequentialScraper(
+                    urls, request_func, lambda html: (parse_records(html), login_prompt_shown(html))
+                )
+                for i, url, (records, truncated) in scraper.iter_results():
+                    planner.feed(url, len(records), truncated)
+
+        Args:
+            page_cap (int, optional): number of results shown on a truncated page, 10 without authentication
+                and 250 with. Defaults to 10.
+            alphabet (str, optional): characters prefixes are expanded with. Defaults to "abcdefghijklmnopqrstuvwxyz".
+            start_length (int, optional): length of the first prefixes. Defaults to 2.
+            max_length (int, optional): prefixes of this length are never expanded. Defaults to 8.
+            category (str, optional): Search category, see `generate_query_url`. Defaults to "all".
+        """
+        validate(page_cap, int)
+        validate(alphabet, str)
+        validate(start_length, int)
+        validate(max_length, int)
+        validate_option(category, CATEGORIES)
+
+        if start_length < 1 or max_length < start_length:
+            raise ValueError(
+                f"Expected 1 <= `start_length` <= `max_length`, got: '{start_length}', '{max_length}'."
+            )
+
+        self.__page_cap: int = page_cap
+        self.__alphabet: str = alphabet
+        self.__max_length: int = max_length
+        self.__category: str = category
+
+        self.__requested: int = 0
+        self.__expanded: int = 0
+
+        self.__frontier: list[str] = [
+            "".join(c) for c in product(alphabet, repeat=start_length)
+        ]
+        self.__pending: dict[str, str] = {}
+
+    def rounds(self) -> Iterator[Iterator[str]]:
+        """
+        Iterate over planning rounds.
+
+        Every round is a lazy iterator of query urls for the current frontier of prefixes. Results for a
+        round must be given to `feed` before the next round is started, truncated prefixes form the
+        frontier of the next round. Iteration stops once a round expands no prefix.
+
+        Yields:
+            Iterator[Iterator[str]]: query urls of a round.
+        """
+        while self.__frontier:
+            frontier: list[str] = self.__frontier
+            self.__frontier = []
+
+            yield self.__urls(frontier)
+
+    def __urls(self, prefixes: list[str]) -> Iterator[str]:
+        urls: Iterator[str] = generate_query_urls(
+            (f"{prefix}*" for prefix in prefixes), category=self.__category
+        )
+
+        for prefix, url in zip(prefixes, urls):
+            self.__pending[url] = prefix
+            self.__requested += 1
+
+            yield url
+
+    def feed(self, url: str, count: int, truncated: bool | NoneType = None) -> None:
+        """
+        Give the number of results found for a planned url.
+
+        A page is truncated if `truncated` is True or `count` reaches `page_cap`. Rows without an email
+        are not counted by the parsers, so a truncated page can have fewer than `page_cap` results, pass
+        the page's own notice (e.g. `cwru.session.login_prompt_shown`) as `truncated` where it has one.
+
+        Args:
+            url (str): query url produced by `rounds`.
+            count (int): number of results on the page.
+            truncated (bool | NoneType, optional): whether the page says more results were found.
+                Defaults to None, meaning only `count` is checked.
+
+        Raises:
+            ValueError: If `url` was not produced by `rounds` or was already fed.
+        """
+        validate(url, str)
+        validate(count, int)
+        validate(truncated, (bool, NoneType))
+
+        try:
+            prefix: str = self.__pending.pop(url)
+        except KeyError:
+            raise ValueError(f"Expected a url planned by `rounds`, got: '{url}'.")
+
+        # a truncated page hides more results, query every child prefix
+        if (truncated or count >= self.__page_cap) and len(prefix) < self.__max_length:
+            self.__frontier += [prefix + c for c in self.__alphabet]
+            self.__expanded += 1
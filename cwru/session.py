@@ -0,0 +1,217 @@
+import re
+from http.client import HTTPResponse
+from threading import Lock
+from types import NoneType
+from typing import Any, Callable
+from cwru.connection import ConnectionPool
+from cwru.fetch import DEFAULT_HEADERS, read_response
+from validate import validate
+
+# directory page with more than 10 results, which shows the login prompt
+LOGIN_URL: str = "https://webapps.case.edu/directory/lookup?search_text=ab*&category=student"
+
+# login prompt shown on result pages when the session is not authenticated
+_LOGIN_PROMPT: re.Pattern = re.compile(r">\s*log in\b", re.IGNORECASE)
+
+
+def login_prompt_shown(html: str) -> bool:
+    """
+    Check if a directory page shows the login prompt, meaning the session is not authenticated.
+
+    Args:
+        html (str): page html.
+
+    Returns:
+        bool: Whether the login prompt is shown.
+    """
+    return _LOGIN_PROMPT.search(html) is not None
+
+
+def selenium_login(driver: Any, username: str, password: str, login_url: str) -> None:
+    """
+    Log a Selenium WebDriver in through the login prompt of a directory page.
+
+    Args:
+        driver (Any): WebDriver.
+        username (str): CWRU username.
+        password (str): CWRU password.
+        login_url (str): directory page showing the login prompt.
+    """
+    from selenium.webdriver.common.by import By
+
+    driver.get(login_url)
+
+    driver.find_element(By.PARTIAL_LINK_TEXT, "log in").click()
+
+    driver.find_element(By.ID, "username").send_keys(username)
+    driver.find_element(By.ID, "password").send_keys(password)
+    driver.find_element(By.ID, "login-submit").click()
+
+
+class SessionProvider:
+    def login(self) -> dict[str, str]:
+        """
+        Log in and return the authentication cookies.
+
+        Returns:
+            dict[str, str]: cookie names and values.
+        """
+        raise NotImplementedError("`login()` must be implemented.")
+
+
+class SeleniumSessionProvider(SessionProvider):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        login_url: str = LOGIN_URL,
+        executable_path: str = "web_drivers/chromedriver.exe",
+    ) -> None:
+        """
+        Session provider that logs in once with a Selenium chromedriver and exports its cookies.
+
+        Requires the `selenium` package.
+
+        Args:
+            username (str): CWRU username.
+            password (str): CWRU password.
+            login_url (str, optional): directory page showing the login prompt.
+                Defaults to a student query with more than 10 results.
+            executable_path (str, optional): path of the chromedriver. Defaults to "web_drivers/chromedriver.exe".
+        """
+        validate(username, str)
+        validate(password, str)
+        validate(login_url, str)
+        validate(executable_path, str)
+
+        self.__username: str = username
+        self.__password: str = password
+        self.__login_url: str = login_url
+        self.__executable_path: str = executable_path
+
+    def login(self) -> dict[str, str]:
+        """
+        Log in with a new chromedriver and return its cookies. The driver is always quit.
+
+        Returns:
+            dict[str, str]: cookie names and values.
+        """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        service: Service = Service(executable_path=self.__executable_path)
+        driver: webdriver.Chrome = webdriver.Chrome(service=service)
+
+        try:
+            selenium_login(driver, self.__username, self.__password, self.__login_url)
+
+            # load the directory again so cookies for its domain are set
+            driver.get(self.__login_url)
+
+            return {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        finally:
+            driver.quit()
+
+
+class AuthenticatedSession:
+    @property
+    def logins(self) -> int:
+        return self.__logins
+
+    @logins.setter
+    def logins(self, logins: int) -> None:
+        raise AttributeError("Cannot set `logins`.")
+
+    @logins.deleter
+    def logins(self) -> None:
+        raise AttributeError("Cannot delete `logins`.")
+
+    def __init__(
+        self,
+        provider: SessionProvider,
+        pool: ConnectionPool | NoneType = None,
+        is_expired: Callable[[str], bool] = login_prompt_shown,
+    ) -> None:
+        """
+        Authenticated directory session.
+
+        Logs in once through `provider` and sends its cookies with every request over pooled keep-alive
+        connections. `request` can be used as the `request_func` of any scraper.
+
+        A response is treated as expired if it redirects, has status 401 or 403, or if `is_expired`
+        returns True for its html. The session then logs in again and retries the request once.
+
+        Args:
+            provider (SessionProvider): provider of authentication cookies.
+            pool (ConnectionPool | NoneType, optional): connection pool to request with. Defaults to None,
+                meaning a new pool.
+            is_expired (Callable[[str], bool], optional): check if a page shows the session expired.
+                Defaults to `login_prompt_shown`.
+        """
+        validate(provider, SessionProvider)
+        validate(pool, (ConnectionPool, NoneType))
+        validate(is_expired, Callable)
+
+        self.__provider: SessionProvider = provider
+        self.__pool: ConnectionPool = pool if pool is not None else ConnectionPool()
+        self.__is_expired: Callable[[str], bool] = is_expired
+
+        self.__cookies: dict[str, str] | NoneType = None
+        self.__generation: int = 0
+        self.__logins: int = 0
+        self.__lock: Lock = Lock()
+
+    def __login(self, generation: int) -> None:
+        with self.__lock:
+            # another thread already logged in again since this one saw the session expire
+            if self.__cookies is not None and self.__generation != generation:
+                return
+
+            self.__cookies = self.__provider.login()
+            self.__generation += 1
+            self.__logins += 1
+
+    def __get(self, url: str) -> tuple[bool, str]:
+        cookie: str = "; ".join(
+            f"{name}={value}" for name, value in self.__cookies.items()
+        )
+
+        response: HTTPResponse = self.__pool.open(
+            url, {**DEFAULT_HEADERS, "Cookie": cookie}
+        )
+        html: str = read_response(response, self.__pool, url)
+        status: int = response.status
+
+        expired: bool = (
+            300 <= status < 400 or status in (401, 403) or self.__is_expired(html)
+        )
+
+        return expired, html
+
+    def request(self, url: str) -> str:
+        """
+        Request `url` with the session cookies, logging in first if needed.
+
+        Args:
+            url (str): url to request.
+
+        Returns:
+            str: html.
+        """
+        if self.__cookies is None:
+            self.__login(self.__generation)
+
+        generation: int = self.__generation
+        expired, html = self.__get(url)
+
+        if expired:
+            self.__login(generation)
+            _, html = self.__get(url)
+
+        return html
+
+    def close(self) -> None:
+        """
+        Close the pooled connections.
+        """
+        self.__pool.close()
@@ -0,0 +1,300 @@
+from itertools import product
+from types import NoneType
+from typing import Iterable, Iterator, NamedTuple
+from cwru.cwru import CATEGORIES, generate_query_url
+from cwru.parser import DirectoryRecord
+from validate import validate
+from validate.vval import validate_option
+
+STRATEGIES: tuple[str, ...] = ("prefix", "surname", "given_name", "phonetic")
+
+
+class SweepQuery(NamedTuple):
+    """
+    A planned directory query.
+    """
+
+    strategy: str
+    search_text: str = ""
+    surname: str = ""
+    given_name: str = ""
+    search_method: str = "regular"
+
+
+def split_name(name: str) -> tuple[str, str]:
+    """
+    Split a directory name into given name and surname.
+
+    Args:
+        name (str): full name, e.g. "Barbara Ann Johnson".
+
+    Returns:
+        tuple[str, str]: given name (first word) and surname (last word), empty strings if missing.
+    """
+    words: list[str] = name.split()
+
+    if not words:
+        return "", ""
+
+    return words[0], words[-1] if len(words) > 1 else ""
+
+
+class SweepPlanner:
+    @property
+    def requested(self) -> int:
+        return self.__requested
+
+    @requested.setter
+    def requested(self, requested: int) -> None:
+        raise AttributeError("Cannot set `requested`.")
+
+    @requested.deleter
+    def requested(self) -> None:
+        raise AttributeError("Cannot delete `requested`.")
+
+    @property
+    def skipped(self) -> int:
+        return self.__skipped
+
+    @skipped.setter
+    def skipped(self, skipped: int) -> None:
+        raise AttributeError("Cannot set `skipped`.")
+
+    @skipped.deleter
+    def skipped(self) -> None:
+        raise AttributeError("Cannot delete `skipped`.")
+
+    @property
+    def emails(self) -> int:
+        return len(self.__emails)
+
+    @emails.setter
+    def emails(self, emails: int) -> None:
+        raise AttributeError("Cannot set `emails`.")
+
+    @emails.deleter
+    def emails(self) -> None:
+        raise AttributeError("Cannot delete `emails`.")
+
+    def __init__(
+        self,
+        page_cap: int = 10,
+        alphabet: str = "abcdefghijklmnopqrstuvwxyz",
+        start_length: int = 2,
+        max_length: int = 8,
+        category: str = "all",
+        strategies: Iterable[str] = STRATEGIES,
+    ) -> None:
+        """
+        Multi-strategy sweep planner.
+
+        Like `PrefixPlanner`, starts from `prefix*` wildcard queries and expands truncated ones. Names
+        harvested from the results plan further query shapes, covering names a wildcard sweep over
+        `alphabet` misses (e.g. "R'Ay"):
+            - "surname" and "given_name": an exact query for every new surname and given name. A
+              truncated surname query is split by given name initial.
+            - "phonetic": a phonetic query with the letters of every new name with characters outside
+              `alphabet`, finding names that sound alike but are spelled with punctuation.
+
+        A name query is skipped when its result set is already covered, i.e. the name starts with a
+        prefix whose page was not truncated, and queries are never repeated.
+
+        Usage:
+            planner = SweepPlanner(page_cap=10, category="student")
+            for urls in planner.rounds():
+                scraper = SequentialScraper(
+                    urls, request_func, lambda html: (parse_records(html), login_prompt_shown(html))
+                )
+                for i, url, (records, truncated) in scraper.iter_results():
+                    planner.feed(url, records, truncated)
+
+        Args:
+            page_cap (int, optional): number of results shown on a truncated page, 10 without authentication
+                and 250 with. Defaults to 10.
+            alphabet (str, optional): characters prefixes are expanded with. Defaults to "abcdefghijklmnopqrstuvwxyz".
+            start_length (int, optional): length of the first prefixes. Defaults to 2.
+            max_length (int, optional): prefixes of this length are never expanded. Defaults to 8.
+            category (str, optional): Search category, see `generate_query_url`. Defaults to "all".
+            strategies (Iterable[str], optional): strategies to plan with, of `STRATEGIES`. Defaults to all of them.
+        """
+        validate(page_cap, int)
+        validate(alphabet, str)
+        validate(start_length, int)
+        validate(max_length, int)
+        validate_option(category, CATEGORIES)
+
+        strategies = set(strategies)
+
+        for strategy in strategies:
+            validate_option(strategy, list(STRATEGIES))
+
+        if start_length < 1 or max_length < start_length:
+            raise ValueError(
+                f"Expected 1 <= `start_length` <= `max_length`, got: '{start_length}', '{max_length}'."
+            )
+
+        self.__page_cap: int = page_cap
+        self.__alphabet: str = alphabet
+        self.__letters: frozenset[str] = frozenset(alphabet.lower())
+        self.__max_length: int = max_length
+        self.__category: str = category
+        self.__strategies: set[str] = strategies
+
+        self.__requested: int = 0
+        self.__skipped: int = 0
+
+        self.__frontier: list[SweepQuery] = (
+            [
+                SweepQuery("prefix", search_text="".join(c))
+                for c in product(alphabet, repeat=start_length)
+            ]
+            if "prefix" in strategies
+            else []
+        )
+        self.__deferred: list[SweepQuery] = []
+        self.__pending: dict[str, SweepQuery] = {}
+
+        # queries already planned, prefixes with complete result sets and harvested names and emails
+        self.__planned: set[SweepQuery] = set(self.__frontier)
+        self.__complete: set[str] = set()
+        self.__names: set[tuple[str, str]] = set()
+        self.__emails: set[str] = set()
+
+    def seed(self, names: Iterable[str]) -> None:
+        """
+        Plan name queries for names known from elsewhere, e.g. a previous run, see `feed`.
+
+        Args:
+            names (Iterable[str]): full names.
+        """
+        for name in names:
+            self.__harvest(name)
+
+    def rounds(self) -> Iterator[Iterator[str]]:
+        """
+        Iterate over planning rounds.
+
+        Every round is a lazy iterator of query urls for the queries planned so far, prefix queries first
+        until no prefix is left to expand, then name queries. Results for a round must be given to `feed`
+        before the next round is started. Iteration stops once a round plans no new query.
+
+        Yields:
+            Iterator[Iterator[str]]: query urls of a round.
+        """
+        while self.__frontier or self.__deferred:
+            # finish the prefix sweep first, so name queries it covers are skipped
+            if not self.__frontier:
+                self.__frontier, self.__deferred = self.__deferred, []
+
+            frontier: list[SweepQuery] = self.__frontier
+            self.__frontier = []
+
+            yield self.__urls(frontier)
+
+    def __covered(self, name: str) -> bool:
+        return any(name[:k] in self.__complete for k in range(1, len(name) + 1))
+
+    def __urls(self, queries: list[SweepQuery]) -> Iterator[str]:
+        for query in queries:
+            # a prefix fed earlier in the round may already cover a name query
+            if query.strategy in ("surname", "given_name") and self.__covered(
+                (query.surname or query.given_name).lower()
+            ):
+                self.__skipped += 1
+                continue
+
+            url: str = generate_query_url(
+                seach_text=f"{query.search_text}*"
+                if query.strategy == "prefix"
+                else query.search_text,
+                surname=query.surname,
+                given_name=query.given_name,
+                category=self.__category,
+                search_method=query.search_method,
+            )
+
+            self.__pending[url] = query
+            self.__requested += 1
+
+            yield url
+
+    def __plan(self, query: SweepQuery) -> None:
+        if query not in self.__planned:
+            self.__planned.add(query)
+
+            if query.strategy == "prefix":
+                self.__frontier.append(query)
+            else:
+                self.__deferred.append(query)
+
+    def __harvest(self, name: str) -> None:
+        given_name, surname = split_name(name)
+
+        for strategy, part in (("given_name", given_name), ("surname", surname)):
+            if not part or (strategy, part.lower()) in self.__names:
+                continue
+
+            self.__names.add((strategy, part.lower()))
+
+            if strategy in self.__strategies:
+                self.__plan(SweepQuery(strategy, **{strategy: part}))
+
+            # letters of a name the wildcard sweep can not spell, e.g. "R'Ay" -> "ray"
+            letters: str = "".join(c for c in part.lower() if c in self.__letters)
+
+            if "phonetic" in self.__strategies and letters and letters != part.lower():
+                self.__plan(
+                    SweepQuery("phonetic", search_text=letters, search_method="phonetic")
+                )
+
+    def feed(
+        self, url: str, records: list[DirectoryRecord], truncated: bool | NoneType = None
+    ) -> None:
+        """
+        Give the records found for a planned url.
+
+        A page is truncated if `truncated` is True or it has `page_cap` records, see `PrefixPlanner.feed`.
+
+        Args:
+            url (str): query url produced by `rounds`.
+            records (list[DirectoryRecord]): records on the page, e.g. from `cwru.parser.parse_records`.
+            truncated (bool | NoneType, optional): whether the page says more results were found.
+                Defaults to None, meaning only the number of records is checked.
+
+        Raises:
+            ValueError: If `url` was not produced by `rounds` or was already fed.
+        """
+        validate(url, str)
+        validate(records, list)
+        validate(truncated, (bool, NoneType))
+
+        try:
+            query: SweepQuery = self.__pending.pop(url)
+        except KeyError:
+            raise ValueError(f"Expected a url planned by `rounds`, got: '{url}'.")
+
+        truncated = bool(truncated) or len(records) >= self.__page_cap
+
+        if query.strategy == "prefix":
+            if not truncated:
+                self.__complete.add(query.search_text.lower())
+            elif len(query.search_text) < self.__max_length:
+                # a page at the cap may hide more results, query every child prefix
+                for c in self.__alphabet:
+                    self.__plan(
+                        SweepQuery("prefix", search_text=query.search_text + c)
+                    )
+        elif (
+            query.strategy == "surname"
+            and truncated
+            and "given_name" in self.__strategies
+        ):
+            # a common surname, split it by given name initial
+            for c in self.__alphabet:
+                self.__plan(
+                    SweepQuery("surname", surname=query.surname, given_name=f"{c}*")
+                )
+
+        for record in records:
+            self.__emails.add(record.email)
+            self.__harvest(record.name)
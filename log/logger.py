@@ -1,7 +1,21 @@
+import atexit
+import sys
+import time
 from pathlib import Path
+from queue import Empty, Queue
+from threading import Event, Thread
 from types import NoneType
-from typing import Any
-from validate.vval import validate
+from typing import Any, TextIO
+from validate.vval import compile_validator, validate
+
+# compiled once, `log` is called for every scraped url
+_validate_msg = compile_validator(str, "msg")
+_validate_indent_level = compile_validator(int, "indent_level")
+_validate_source = compile_validator((str, NoneType), "source")
+
+
+# tells the writer thread to write its pending lines and stop
+_CLOSE: object = object()
 
 
 class Logger:
@@ -56,21 +70,143 @@ class Logger:
 
         self.__file_ = file_
 
+    @property
+    def buffered(self) -> bool:
+        return self.__buffered
+
+    @buffered.setter
+    def buffered(self, buffered: bool) -> None:
+        raise AttributeError("Cannot set `buffered`.")
+
+    @buffered.deleter
+    def buffered(self) -> None:
+        raise AttributeError("Cannot delete `buffered`.")
+
     def __init__(
         self,
         file_path: str | Path | NoneType | Any,
         print_: bool = True,
         file_: bool = True,
+        buffered: bool = False,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        max_queued: int = 10_000,
     ) -> None:
+        """
+        Logger.
+
+        In buffered mode lines are handed to a background writer thread through a bounded queue. The writer
+        keeps the log file open and writes lines in batches, once `batch_size` lines are pending, every
+        `flush_interval` seconds, on `flush` and at exit. `log` blocks once `max_queued` lines are waiting.
+
+        Args:
+            file_path (str | Path | NoneType | Any): path of the log file.
+            print_ (bool, optional): Whether to print lines to stdout. Defaults to True.
+            file_ (bool, optional): Whether to write lines to `file_path`. Defaults to True.
+            buffered (bool, optional): Whether to write lines from a background writer thread. Defaults to False.
+            batch_size (int, optional): Number of pending lines that triggers a write when `buffered`. Defaults to 256.
+            flush_interval (float, optional): Maximum seconds a line stays pending when `buffered`. Defaults to 1.0.
+            max_queued (int, optional): Maximum number of lines waiting for the writer when `buffered`.
+                Defaults to 10_000.
+        """
         self.__log_num: int = 0
         self.__print: bool = True
         self.__file_: bool = True
         self.__path: Path | NoneType = None
+        self.__buffered: bool = False
+        self.__queue: Queue | NoneType = None
+        self.__writer: Thread | NoneType = None
 
         self.print = print_
         self.file_ = file_
         self.file_path = file_path
 
+        validate(buffered, bool)
+        validate(batch_size, int)
+        validate(flush_interval, (int, float))
+        validate(max_queued, int)
+
+        self.__batch_size: int = batch_size
+        self.__flush_interval: float = flush_interval
+
+        if buffered:
+            self.__buffered = True
+            self.__queue = Queue(maxsize=max_queued)
+            self.__writer = Thread(target=self.__write_loop, daemon=True)
+            self.__writer.start()
+
+            atexit.register(self.close)
+
+    def __write_loop(self) -> None:
+        file: TextIO | NoneType = None
+        pending: list[str] = []
+        last_write: float = time.monotonic()
+
+        while True:
+            timeout: float = self.__flush_interval - (time.monotonic() - last_write)
+
+            try:
+                item: str | Event | object | NoneType = self.__queue.get(
+                    timeout=max(timeout, 0)
+                )
+            except Empty:
+                item = None
+
+            if isinstance(item, str):
+                pending.append(item)
+
+                if len(pending) < self.__batch_size:
+                    continue
+
+            # write on size, on interval, on `flush` and on `close`
+            if pending:
+                lines: str = "".join(pending)
+                pending = []
+
+                if self.print:
+                    sys.stdout.write(lines)
+                    sys.stdout.flush()
+
+                if self.file_:
+                    if file is None:
+                        file = open(self.file_path, "a")
+
+                    file.write(lines)
+                    file.flush()
+
+            last_write = time.monotonic()
+
+            if isinstance(item, Event):
+                item.set()
+            elif item is _CLOSE:
+                break
+
+        if file is not None:
+            file.close()
+
+    def flush(self) -> None:
+        """
+        Wait until every line logged so far is written. Does nothing unless `buffered`.
+        """
+        if self.__writer is None or not self.__writer.is_alive():
+            return
+
+        flushed: Event = Event()
+        self.__queue.put(flushed)
+        flushed.wait()
+
+    def close(self) -> None:
+        """
+        Write every pending line and stop the writer thread. Does nothing unless `buffered`.
+        """
+        if self.__writer is None or not self.__writer.is_alive():
+            return
+
+        self.__queue.put(_CLOSE)
+        self.__writer.join()
+
+        atexit.unregister(self.close)
+
     def log(
         self, msg: str, indent_level: int = 0, source: str | NoneType = None
     ) -> None:
@@ -82,9 +218,9 @@ class Logger:
             indent_level (int, optional): Indentation level. Defaults to 0.
         """
 
-        validate(msg, str)
-        validate(indent_level, int)
-        validate(source, (str, NoneType))
+        _validate_msg(msg)
+        _validate_indent_level(indent_level)
+        _validate_source(source)
 
         indent: str = "    " * indent_level
 
@@ -93,11 +229,17 @@ class Logger:
         else:
             _msg: str = f"{str(self.log_num).rjust(7)}  {indent} {msg}"
 
-        if self.print:
-            print(_msg)
+        if self.buffered:
+            if self.__writer is None or not self.__writer.is_alive():
+                raise ValueError("Cannot log to a closed logger.")
+
+            self.__queue.put(_msg + "\n")
+        else:
+            if self.print:
+                print(_msg)
 
-        if self.file_:
-            with open(self.file_path, "a") as file:
-                file.write(_msg + "\n")
+            if self.file_:
+                with open(self.file_path, "a") as file:
+                    file.write(_msg + "\n")
 
         self.__log_num += 1
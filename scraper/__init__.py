@@ -1,3 +1,10 @@
 from scraper.scraper import Scraper
 from scraper.batch_scraper import BatchScraper
-from scraper.sequential_scraper import SequentialScraper
\ No newline at end of file
+from scraper.sequential_scraper import SequentialScraper
+from scraper.concurrent_scraper import ConcurrentScraper
+from scraper.async_scraper import AsyncScraper
+from scraper.journal import Journal
+from scraper.cache import ResponseCache
+from scraper.metrics import Metrics
+from scraper.page_store import PageStore, FileStore, PackStore
+from scraper.scheduler import RequestScheduler, TokenBucket
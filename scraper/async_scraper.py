@@ -0,0 +1,331 @@
+import asyncio
+import time
+from pathlib import Path
+from types import NoneType
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from scraper.cache import ResponseCache
+from scraper.journal import Journal
+from scraper.metrics import Metrics
+from scraper.scraper import Scraper
+from validate import validate
+
+
+class AsyncScraper(Scraper):
+    @property
+    def limit(self) -> int:
+        return self.__limit
+
+    @limit.setter
+    def limit(self, limit: int) -> None:
+        validate(limit, int)
+
+        if limit < 1:
+            raise ValueError(f"Expected `limit` >= 1, got: '{limit}'.")
+
+        self.__limit = limit
+
+    @limit.deleter
+    def limit(self) -> None:
+        raise AttributeError("Cannot delete `limit`.")
+
+    @property
+    def scrape_in_executor(self) -> bool:
+        return self.__scrape_in_executor
+
+    @scrape_in_executor.setter
+    def scrape_in_executor(self, scrape_in_executor: bool) -> None:
+        validate(scrape_in_executor, bool)
+
+        self.__scrape_in_executor = scrape_in_executor
+
+    @scrape_in_executor.deleter
+    def scrape_in_executor(self) -> None:
+        raise AttributeError("Cannot delete `scrape_in_executor`.")
+
+    @property
+    def errors(self) -> dict[int, Exception]:
+        return self.__errors
+
+    @errors.setter
+    def errors(self, errors: dict[int, Exception]) -> None:
+        raise AttributeError("Cannot set `errors`.")
+
+    @errors.deleter
+    def errors(self) -> None:
+        raise AttributeError("Cannot delete `errors`.")
+
+    def __init__(
+        self,
+        url: str | Iterable[str],
+        request_func: Callable[[str], Awaitable[str]] | Callable[[str], str],
+        scrape_func: Callable[[str], str],
+        limit: int = 100,
+        scrape_in_executor: bool = True,
+        journal: Journal | str | Path | NoneType = None,
+        cache: ResponseCache | NoneType = None,
+        metrics: Metrics | NoneType = None,
+    ) -> None:
+        """
+        Asyncio scraper.
+
+        Will drive all urls from a single event loop, with at most `limit` requests running at once.
+        `request_func` is expected to be a coroutine function, synchronous request functions are run
+        in the default executor.
+
+        Args:
+            url (str | Iterable[str]): url or urls to scrape.
+            request_func (Callable[[str], Awaitable[str]] | Callable[[str], str]): function to request html from a url.
+                Expects single str argument and returns str or an awaitable of str.
+            scrape_func (Callable[[str], str]): function to scrape html. Expects single str argument and returns Any.
+            limit (int, optional): maximum number of concurrent requests. Defaults to 100.
+            scrape_in_executor (bool, optional): whether to run `scrape_func` in the default executor so it does not
+                block the event loop. Defaults to True.
+            journal (Journal | str | Path | NoneType, optional): checkpoint journal, or path of one, used to resume
+                an interrupted run. Defaults to None.
+            cache (ResponseCache | NoneType, optional): cache of responses checked before calling `request_func`.
+                Defaults to None.
+            metrics (Metrics | NoneType, optional): sink for per url request and scrape metrics. Defaults to None.
+        """
+
+        super().__init__(url, request_func, scrape_func)
+
+        self.__limit: int = 100
+        self.__scrape_in_executor: bool = True
+        self.__errors: dict[int, Exception] = {}
+
+        self.limit = limit
+        self.scrape_in_executor = scrape_in_executor
+        self.journal = journal
+        self.cache = cache
+        self.metrics = metrics
+
+    async def _async_request(self, url: str) -> str:
+        """
+        Request a single url, going through `cache` if one is set.
+
+        Args:
+            url (str): url to request.
+
+        Returns:
+            str: response.
+        """
+        response: str | NoneType = None
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # cache reads, writes and evictions are file io, keep them off the event loop
+        if self.cache is not None:
+            response = await loop.run_in_executor(None, self.cache.get, url)
+
+        if response is None:
+            if asyncio.iscoroutinefunction(self.request_func):
+                response = await self.request_func(url)
+            else:
+                response = await loop.run_in_executor(None, self.request_func, url)
+
+            if self.cache is not None:
+                await loop.run_in_executor(None, self.cache.put, url, response)
+
+        return response
+
+    async def _process(self, i: int, url: str) -> Any:
+        """
+        Request and scrape a single url, recording both in `metrics` if set.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url to process.
+
+        Returns:
+            Any: scraped result.
+        """
+        start: float = time.perf_counter()
+
+        try:
+            response: str = await self._async_request(url)
+        except Exception as e:
+            if self.metrics is not None:
+                self.metrics.record_request(i, url, time.perf_counter() - start, error=e)
+
+            raise
+
+        if self.metrics is not None:
+            self.metrics.record_request(i, url, time.perf_counter() - start, response)
+
+        if self.scrape_in_executor:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._scrape, i, url, response
+            )
+
+        return self._scrape(i, url, response)
+
+    async def aiter_results(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> AsyncIterator[tuple[int, str, Any]]:
+        """
+        Request and scrape urls on the running event loop, yielding results in completion order.
+
+        Errors raised while processing a url do not abort the run, they are stored in `errors`
+        keyed by the url iteration number and the yielded result for that url is None. If a `journal`
+        is set, urls it records as scraped are not requested again and their recorded result is yielded
+        instead.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every request is started.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Yields:
+            AsyncIterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+
+        validate(callback, (Callable, NoneType))
+
+        self.__errors = {}
+
+        finished: asyncio.Queue[tuple[int, str, Any]] = asyncio.Queue()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.limit)
+        tasks: set[asyncio.Task] = set()
+        submitted: int = 0
+        yielded: int = 0
+
+        async def worker(i: int, url: str) -> None:
+            result: Any = None
+
+            try:
+                result = await self._process(i, url)
+
+                # an unpicklable result or a failed journal write is an error of this url
+                if self.journal is not None:
+                    self.journal.record_scraped(i, url, result)
+            except Exception as e:
+                self.__errors[i] = e
+                result = None
+
+                if self.journal is not None:
+                    self.journal.record_failed(i, url)
+            finally:
+                semaphore.release()
+
+                # always hand the url back, or `aiter_results` would wait for it forever
+                finished.put_nowait((i, url, result))
+
+        async def producer() -> None:
+            nonlocal submitted
+
+            for i, url in enumerate(self.iter_urls()):
+                # replay work completed by a previous run
+                if self.journal is not None and self.journal.is_scraped(i, url):
+                    finished.put_nowait((i, url, self.journal.result(i)))
+                    submitted += 1
+                    continue
+
+                # acquire before creating the task so pending urls are not materialized as tasks
+                await semaphore.acquire()
+
+                if callback is not None:
+                    callback(i, url)
+
+                task: asyncio.Task = asyncio.create_task(worker(i, url))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+                submitted += 1
+
+        producing: asyncio.Task = asyncio.create_task(producer())
+
+        try:
+            while not producing.done() or yielded < submitted:
+                if producing.done():
+                    # surface errors raised while iterating urls or in `callback`
+                    producing.result()
+
+                    item: tuple[int, str, Any] = await finished.get()
+                else:
+                    getting: asyncio.Task = asyncio.create_task(finished.get())
+                    await asyncio.wait(
+                        {getting, producing}, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    if not getting.done():
+                        getting.cancel()
+                        continue
+
+                    item = getting.result()
+
+                yielded += 1
+                yield item
+
+            producing.result()
+        finally:
+            producing.cancel()
+
+            for task in tasks:
+                task.cancel()
+
+    async def run_async(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> list[Any]:
+        """
+        Run the asyncio scraper on the running event loop.
+
+        Errors raised while processing a url do not abort the run, they are stored in `errors`
+        keyed by the url iteration number and the result for that url is None.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every request is started.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Returns:
+            list[Any]: List of results, in url order.
+        """
+
+        results: list[Any] = []
+
+        async for i, _, result in self.aiter_results(callback):
+            if i >= len(results):
+                results.extend([None] * (i + 1 - len(results)))
+
+            results[i] = result
+
+        return results
+
+    def iter_results(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Run the asyncio scraper in a new event loop, yielding results in completion order.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every request is started.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        results: AsyncIterator[tuple[int, str, Any]] = self.aiter_results(callback)
+
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(anext(results))
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def run(self, callback: Callable[[int, str], Any] | NoneType = None) -> list[Any]:
+        """
+        Run the asyncio scraper in a new event loop.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every request is started.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Returns:
+            list[Any]: List of results, in url order.
+        """
+
+        return asyncio.run(self.run_async(callback))
@@ -1,10 +1,54 @@
+import time
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
+from queue import Queue
+from threading import Thread
 from types import NoneType
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator
+from scraper.cache import ResponseCache
+from scraper.journal import Journal
+from scraper.metrics import Metrics
+from scraper.page_store import FileStore, PageStore
 from scraper.scraper import Scraper
 from validate import validate
 
 
+def _scrape_page(
+    scrape_func: Callable[[Any], Any], load: Callable[[], Any], mapped: bool
+) -> tuple[Any, float]:
+    """
+    Read and scrape a stored page. Runs inside a worker process.
+
+    Args:
+        scrape_func (Callable[[Any], Any]): function to scrape html.
+        load (Callable[[], Any]): function reading the stored html, see `PageStore.loader` and `PageStore.mapper`.
+        mapped (bool): whether `load` returns a view of the page instead of the html.
+
+    Returns:
+        tuple[Any, float]: scraped result and seconds the scrape took.
+    """
+    if mapped:
+        with load() as page:
+            start: float = time.perf_counter()
+            result: Any = scrape_func(page)
+    else:
+        response: str = load()
+
+        start = time.perf_counter()
+        result = scrape_func(response)
+
+    duration: float = time.perf_counter() - start
+
+    return result, duration
+
+
 class BatchScraper(Scraper):
     @property
     def path(self) -> Path:
@@ -23,12 +67,30 @@ class BatchScraper(Scraper):
     def path(self) -> None:
         raise AttributeError("Cannot delete `path`.")
 
+    @property
+    def store(self) -> PageStore:
+        return self.__store
+
+    @store.setter
+    def store(self, store: PageStore | NoneType) -> None:
+        validate(store, (PageStore, NoneType))
+
+        self.__store = store if store is not None else FileStore(self.path)
+
+    @store.deleter
+    def store(self) -> None:
+        raise AttributeError("Cannot delete `store`.")
+
     def __init__(
         self,
         url: str | Iterable[str],
         request_func: Callable[[str], str],
         scrape_func: Callable[[str], str],
         path: str | Path | Any,
+        journal: Journal | str | Path | NoneType = None,
+        cache: ResponseCache | NoneType = None,
+        metrics: Metrics | NoneType = None,
+        store: PageStore | NoneType = None,
     ) -> None:
         """
         Batch scraper.
@@ -40,17 +102,97 @@ class BatchScraper(Scraper):
             request_func (Callable[[str], str]): function to request html from a url. Expects single str argument and returns str.
             scrape_func (Callable[[str], str]): function to scrape html. Expects single str argument and returns Any.
             path (str | Path | Any, optional): path to store requested html.
+            journal (Journal | str | Path | NoneType, optional): checkpoint journal, or path of one, used to resume
+                an interrupted run. Stored html recorded as requested is not requested again and urls recorded
+                as scraped are neither requested nor scraped again. Defaults to None.
+            cache (ResponseCache | NoneType, optional): cache of responses checked before calling `request_func`.
+                Defaults to None.
+            metrics (Metrics | NoneType, optional): sink for per url request and scrape metrics. Defaults to None.
+            store (PageStore | NoneType, optional): storage of requested html, e.g. a `PackStore` keeping
+                deduplicated, compressed pages in a single file. Defaults to None, meaning a `FileStore`
+                writing one `{path}/{i}.html` file per url.
         """
         super().__init__(url, request_func, scrape_func)
 
         self.__path: Path = None
         self.path = path
+        self.__store: PageStore = None
+        self.store = store
+        self.journal = journal
+        self.cache = cache
+        self.metrics = metrics
+
+    def _is_done(self, i: int, url: str) -> bool:
+        """
+        Check if `journal` records url iteration number `i` as scraped.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+
+        Returns:
+            bool: Whether the url was scraped by a previous run.
+        """
+        return self.journal is not None and self.journal.is_scraped(i, url)
+
+    def _is_stored(self, i: int, url: str) -> bool:
+        """
+        Check if `journal` records url iteration number `i` as requested and its html is still stored.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+
+        Returns:
+            bool: Whether the url does not need to be requested again.
+        """
+        return (
+            self.journal is not None
+            and self.journal.is_requested(i, url)
+            and self.store.contains(i)
+        )
+
+    def _index_path(self) -> Path:
+        """
+        Path of the file mapping url iteration numbers to urls for stored html.
+
+        Returns:
+            Path: file path.
+        """
+        return Path(f"{self.path}/urls.idx")
+
+    def _iter_stored(self) -> Iterator[tuple[int, str]]:
+        """
+        Iterate over the url iteration numbers and urls of stored html.
+
+        Reads the index written by `batch_request` so `urls` is not iterated a second time,
+        falls back to `urls` if there is no index.
+
+        Yields:
+            Iterator[tuple[int, str]]: url iteration number and url.
+        """
+        index_path: Path = self._index_path()
+
+        if not index_path.exists():
+            yield from enumerate(self.iter_urls())
+            return
+
+        with open(index_path) as index:
+            for line in index:
+                i, url = line.rstrip("\n").split("\t", 1)
+
+                yield int(i), url
 
     def run(
         self,
         request_callback: Callable[[int, str], Any] = None,
         scrape_callback: Callable[[int, str], Any] = None,
         delete_after_use: bool = True,
+        pipelined: bool = False,
+        max_queued: int = 16,
+        processes: int | NoneType = None,
+        workers: int = 1,
+        mapped: bool = False,
     ) -> list[Any]:
         """
         Run the batch scraper.
@@ -60,53 +202,401 @@ class BatchScraper(Scraper):
                 It is called with the current url iteration number and the url. Defaults to None.
             scrape_callback (Callable[[int, str], Any], optional): Called at the start of every sequential scrape iteration.
                 It is called with the current url iteration number and the url. Defaults to None.
+            delete_after_use (bool, optional): Whether to delete stored html after it is scraped. Defaults to True.
+            pipelined (bool, optional): Whether to scrape stored html while still requesting. See `batch_pipeline`.
+                Defaults to False.
+            max_queued (int, optional): Maximum number of stored but not yet scraped pages when `pipelined`.
+                Defaults to 16.
+            processes (int | NoneType, optional): Number of worker processes for the scrape stage, see `batch_scrape`.
+                Ignored when `pipelined`. Defaults to None.
+            workers (int, optional): Number of threads for the request stage, see `batch_request`.
+                Ignored when `pipelined`. Defaults to 1.
+            mapped (bool, optional): Whether to scrape memory mapped utf-8 bytes instead of html strings,
+                see `batch_scrape`. Defaults to False.
 
         Returns:
             list[Any]: List of results.
         """
 
-        self.batch_request(request_callback)
-        results: list[Any] = self.batch_scrape(scrape_callback, delete_after_use)
+        validate(pipelined, bool)
+
+        if pipelined:
+            return self.batch_pipeline(
+                request_callback, scrape_callback, delete_after_use, max_queued, mapped
+            )
+
+        self.batch_request(request_callback, workers)
+        results: list[Any] = self.batch_scrape(
+            scrape_callback, delete_after_use, processes, mapped
+        )
         return results
 
+    def _store(self, i: int, url: str) -> None:
+        """
+        Request `url` and store the response, recording the request in `journal` if set.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url to request.
+        """
+        try:
+            response = self._request(i, url)
+
+            self.store.put(i, response)
+        except Exception:
+            if self.journal is not None:
+                self.journal.record_failed(i, url)
+
+            raise
+
+        if self.journal is not None:
+            self.journal.record_requested(i, url)
+
     def batch_request(
-        self, request_callback: Callable[[int, str], Any] | NoneType = None
+        self,
+        request_callback: Callable[[int, str], Any] | NoneType = None,
+        workers: int = 1,
     ) -> None:
         """
         Batch request all urls. And store them in `self.path`
 
         Args:
-            request_callback (Callable[[int, str], Any] | NoneType, optional): _description_. Defaults to None.
+            request_callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every request.
+                It is called with the current url iteration number and the url. Defaults to None.
+            workers (int, optional): Number of threads requesting at the same time, e.g. one per driver of a
+                `cwru.browser_pool.BrowserPool`. Defaults to 1.
         """
         validate(request_callback, (Callable, NoneType))
+        validate(workers, int)
+
+        if workers < 1:
+            raise ValueError(f"Expected `workers` >= 1, got: '{workers}'.")
+
+        in_flight: set[Future] = set()
+
+        # urls are consumed once, the index file remembers which url each stored page belongs to
+        with open(self._index_path(), "w") as index, ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            try:
+                for i, url in enumerate(self.iter_urls()):
+                    index.write(f"{i}\t{url}\n")
 
-        for i, url in enumerate(self.urls):
-            if request_callback is not None:
-                request_callback(i, url)
+                    # skip work recorded by a previous run
+                    if self._is_done(i, url) or self._is_stored(i, url):
+                        continue
 
-            response = self.request_func(url)
+                    if request_callback is not None:
+                        request_callback(i, url)
 
-            file_path: Path = Path(f"{self.path}/{i}.html")
-            file_path.write_text(response)
+                    if workers == 1:
+                        self._store(i, url)
+                        continue
+
+                    # wait for a slot, stopping at the first failed request
+                    if len(in_flight) >= workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            future.result()
+
+                    in_flight.add(executor.submit(self._store, i, url))
+            finally:
+                done, _ = wait(in_flight)
+
+            for future in done:
+                future.result()
 
     def batch_scrape(
         self,
         scrape_callback: Callable[[int, str], Any] | NoneType = None,
         delete_after_use: bool = True,
+        processes: int | NoneType = None,
+        mapped: bool = False,
     ) -> list[Any]:
+        """
+        Batch scrape all urls stored in `self.path`.
+
+        Args:
+            scrape_callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every scrape iteration.
+                It is called with the current url iteration number and the url. Defaults to None.
+            delete_after_use (bool, optional): Whether to delete stored html after it is scraped. Defaults to True.
+            processes (int | NoneType, optional): Number of worker processes to scrape with. Workers read the stored
+                html themselves, so `scrape_func` must be picklable (e.g. a module level function, not a lambda).
+                Defaults to None, meaning scrape in this process.
+            mapped (bool, optional): Whether to call `scrape_func` with a memory mapped view of the utf-8 encoded
+                page (see `PageStore.view`) instead of a decoded html string, for byte oriented scrape functions
+                such as `cwru.parser.extract_emails_bytes`. The view is only valid during the call, so results must
+                not reference it. Defaults to False.
+
+        Returns:
+            list[Any]: List of results.
+        """
         validate(scrape_callback, (Callable, NoneType))
         validate(delete_after_use, bool)
+        validate(processes, (int, NoneType))
+        validate(mapped, bool)
 
-        results: list[Any] = []
+        if processes is not None:
+            return self.__batch_scrape_processes(
+                scrape_callback, delete_after_use, processes, mapped
+            )
+
+        return [
+            result
+            for _, _, result in self.iter_scrape(scrape_callback, delete_after_use, mapped)
+        ]
+
+    def iter_scrape(
+        self,
+        scrape_callback: Callable[[int, str], Any] | NoneType = None,
+        delete_after_use: bool = True,
+        mapped: bool = False,
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Lazily scrape all urls stored in `self.path`, yielding results as each page is scraped.
+
+        Args:
+            scrape_callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every scrape iteration.
+                It is called with the current url iteration number and the url. Defaults to None.
+            delete_after_use (bool, optional): Whether to delete stored html after it is scraped. Defaults to True.
+            mapped (bool, optional): Whether to scrape memory mapped utf-8 bytes, see `batch_scrape`.
+                Defaults to False.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+        validate(scrape_callback, (Callable, NoneType))
+        validate(delete_after_use, bool)
+        validate(mapped, bool)
+
+        for i, url in self._iter_stored():
+            # replay results recorded by a previous run
+            if self._is_done(i, url):
+                if delete_after_use:
+                    self.store.delete(i)
+
+                yield i, url, self.journal.result(i)
+                continue
 
-        for i, url in enumerate(self.urls):
             if scrape_callback is not None:
                 scrape_callback(i, url)
 
-            file_path: Path = Path(f"{self.path}/{i}.html")
-            response: str = file_path.read_text()
-            results.append(self.scrape_func(response))
+            result: Any = self.__scrape_stored(i, url, mapped)
+
+            if self.journal is not None:
+                self.journal.record_scraped(i, url, result)
+
             if delete_after_use:
-                file_path.unlink()
+                self.store.delete(i)
+
+            yield i, url, result
+
+        if delete_after_use:
+            self.store.clear()
+            self._index_path().unlink(missing_ok=True)
+
+    def __scrape_stored(self, i: int, url: str, mapped: bool) -> Any:
+        if not mapped:
+            return self._scrape(i, url, self.store.get(i))
+
+        with self.store.view(i) as page:
+            return self._scrape(i, url, page)
+
+    def iter_results(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Batch request all urls, then lazily scrape and delete them, yielding results as each page is scraped.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every request iteration.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+        self.batch_request(callback)
+
+        yield from self.iter_scrape()
+
+    def __batch_scrape_processes(
+        self,
+        scrape_callback: Callable[[int, str], Any] | NoneType,
+        delete_after_use: bool,
+        processes: int,
+        mapped: bool,
+    ) -> list[Any]:
+        if processes < 1:
+            raise ValueError(f"Expected `processes` >= 1, got: '{processes}'.")
+
+        results: list[Any] = []
+        pending: deque[tuple[int, str, Future]] = deque()
+
+        def collect() -> None:
+            i, url, future = pending.popleft()
+
+            try:
+                result, duration = future.result()
+            except Exception as e:
+                if self.metrics is not None:
+                    self.metrics.record_scrape(i, url, 0.0, error=e)
+
+                raise
+
+            if self.metrics is not None and duration is not None:
+                self.metrics.record_scrape(i, url, duration, result)
+
+            if self.journal is not None and not self.journal.is_scraped(i, url):
+                self.journal.record_scraped(i, url, result)
+
+            if delete_after_use:
+                self.store.delete(i)
+
+            results.append(result)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for i, url in self._iter_stored():
+                # collect results in order, keeping a few tasks queued per worker
+                if len(pending) >= processes * 4:
+                    collect()
+
+                # replay results recorded by a previous run
+                if self._is_done(i, url):
+                    future: Future = Future()
+                    future.set_result((self.journal.result(i), None))
+                    pending.append((i, url, future))
+                    continue
+
+                if scrape_callback is not None:
+                    scrape_callback(i, url)
+
+                pending.append(
+                    (
+                        i,
+                        url,
+                        executor.submit(
+                            _scrape_page,
+                            self.scrape_func,
+                            self.store.mapper(i) if mapped else self.store.loader(i),
+                            mapped,
+                        ),
+                    )
+                )
+
+            while pending:
+                collect()
+
+        if delete_after_use:
+            self.store.clear()
+            self._index_path().unlink(missing_ok=True)
+
+        return results
+
+    def batch_pipeline(
+        self,
+        request_callback: Callable[[int, str], Any] | NoneType = None,
+        scrape_callback: Callable[[int, str], Any] | NoneType = None,
+        delete_after_use: bool = True,
+        max_queued: int = 16,
+        mapped: bool = False,
+    ) -> list[Any]:
+        """
+        Request and scrape all urls at the same time.
+
+        Every file stored in `self.path` is queued straight away for a scraper thread, so parsing overlaps
+        with requesting. Requesting blocks once `max_queued` pages are waiting to be scraped, which keeps
+        the number of stored files near `max_queued` when `delete_after_use` is set.
+
+        Args:
+            request_callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every request.
+                It is called with the current url iteration number and the url. Defaults to None.
+            scrape_callback (Callable[[int, str], Any] | NoneType, optional): Called at the start of every scrape.
+                It is called with the current url iteration number and the url. Defaults to None.
+            delete_after_use (bool, optional): Whether to delete stored html after it is scraped. Defaults to True.
+            max_queued (int, optional): Maximum number of stored but not yet scraped pages. Defaults to 16.
+            mapped (bool, optional): Whether to scrape memory mapped utf-8 bytes, see `batch_scrape`.
+                Defaults to False.
+
+        Returns:
+            list[Any]: List of results.
+        """
+        validate(request_callback, (Callable, NoneType))
+        validate(scrape_callback, (Callable, NoneType))
+        validate(delete_after_use, bool)
+        validate(max_queued, int)
+        validate(mapped, bool)
+
+        if max_queued < 1:
+            raise ValueError(f"Expected `max_queued` >= 1, got: '{max_queued}'.")
+
+        results: list[Any] = []
+        queue: Queue[tuple[int, str] | NoneType] = Queue(maxsize=max_queued)
+        errors: list[Exception] = []
+
+        def scrape_worker() -> None:
+            while (item := queue.get()) is not None:
+                # keep draining after an error so the requester never blocks on a full queue
+                if errors:
+                    continue
+
+                i, url = item
+
+                try:
+                    if scrape_callback is not None:
+                        scrape_callback(i, url)
+
+                    results[i] = self.__scrape_stored(i, url, mapped)
+
+                    if self.journal is not None:
+                        self.journal.record_scraped(i, url, results[i])
+
+                    if delete_after_use:
+                        self.store.delete(i)
+                except Exception as e:
+                    errors.append(e)
+
+        worker: Thread = Thread(target=scrape_worker, daemon=True)
+        worker.start()
+
+        try:
+            for i, url in enumerate(self.iter_urls()):
+                if errors:
+                    break
+
+                results.append(None)
+
+                # replay results recorded by a previous run
+                if self._is_done(i, url):
+                    results[i] = self.journal.result(i)
+                    continue
+
+                if not self._is_stored(i, url):
+                    if request_callback is not None:
+                        request_callback(i, url)
+
+                    try:
+                        response = self._request(i, url)
+
+                        self.store.put(i, response)
+                    except Exception:
+                        if self.journal is not None:
+                            self.journal.record_failed(i, url)
+
+                        raise
+
+                    if self.journal is not None:
+                        self.journal.record_requested(i, url)
+
+                queue.put((i, url))
+        finally:
+            queue.put(None)
+            worker.join()
+
+        if errors:
+            raise errors[0]
+
+        if delete_after_use:
+            self.store.clear()
 
         return results
@@ -0,0 +1,221 @@
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from types import NoneType
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from validate import validate
+
+# entries are named by the sha256 hex digest of their url, other files are not the cache's
+_KEY: re.Pattern = re.compile(r"[0-9a-f]{64}")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize `url` so equivalent urls share a cache entry.
+
+    The scheme and host are lowercased, the fragment is dropped and query parameters are sorted.
+
+    Args:
+        url (str): url.
+
+    Returns:
+        str: normalized url.
+    """
+    validate(url, str)
+
+    parts = urlsplit(url)
+    query: str = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+class ResponseCache:
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    @property
+    def ttl(self) -> float | NoneType:
+        return self.__ttl
+
+    @ttl.setter
+    def ttl(self, ttl: int | float | NoneType) -> None:
+        validate(ttl, (int, float, NoneType))
+
+        self.__ttl = ttl
+
+    @ttl.deleter
+    def ttl(self) -> None:
+        self.__ttl = None
+
+    @property
+    def max_size(self) -> int | NoneType:
+        return self.__max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int | NoneType) -> None:
+        validate(max_size, (int, NoneType))
+
+        self.__max_size = max_size
+
+        with self.__lock:
+            self.__evict()
+
+    @max_size.deleter
+    def max_size(self) -> None:
+        self.__max_size = None
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @size.setter
+    def size(self, size: int) -> None:
+        raise AttributeError("Cannot set `size`.")
+
+    @size.deleter
+    def size(self) -> None:
+        raise AttributeError("Cannot delete `size`.")
+
+    def __init__(
+        self,
+        path: str | Path | Any,
+        ttl: int | float | NoneType = None,
+        max_size: int | NoneType = None,
+    ) -> None:
+        """
+        On disk cache of responses keyed by normalized url.
+
+        Entries older than `ttl` seconds are treated as missing, and the least recently used entries
+        are evicted once the total size of the cache exceeds `max_size` bytes. Only files the cache wrote
+        (named by the sha256 digest of their url) are loaded, evicted or cleared, other files in `path`
+        are left alone.
+
+        Args:
+            path (str | Path | Any): directory to store responses in.
+            ttl (int | float | NoneType, optional): seconds an entry stays valid. Defaults to None, meaning forever.
+            max_size (int | NoneType, optional): maximum total size of stored responses in bytes.
+                Defaults to None, meaning unbounded.
+        """
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+        self.__ttl: float | NoneType = None
+        self.__max_size: int | NoneType = None
+        self.__size: int = 0
+        self.__entries: OrderedDict[str, int] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+        self.__path.mkdir(parents=True, exist_ok=True)
+        self.__load()
+
+        self.ttl = ttl
+        self.max_size = max_size
+
+    def __load(self) -> None:
+        # access times order the entries from least to most recently used
+        files: list[os.DirEntry] = [
+            entry
+            for entry in os.scandir(self.__path)
+            if _KEY.fullmatch(entry.name) and entry.is_file()
+        ]
+        files.sort(key=lambda entry: entry.stat().st_atime)
+
+        for entry in files:
+            size: int = entry.stat().st_size
+            self.__entries[entry.name] = size
+            self.__size += size
+
+    def __key(self, url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def __remove(self, key: str) -> None:
+        self.__size -= self.__entries.pop(key)
+        (self.__path / key).unlink(missing_ok=True)
+
+    def __evict(self) -> None:
+        if self.__max_size is None:
+            return
+
+        while self.__entries and self.__size > self.__max_size:
+            self.__remove(next(iter(self.__entries)))
+
+    def get(self, url: str) -> str | NoneType:
+        """
+        Get the cached response for `url`.
+
+        Args:
+            url (str): url.
+
+        Returns:
+            str | NoneType: cached response, or None if there is no valid entry.
+        """
+        key: str = self.__key(url)
+        file_path: Path = self.__path / key
+
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+
+            try:
+                modified: float = file_path.stat().st_mtime
+
+                if self.ttl is not None and time.time() - modified > self.ttl:
+                    self.__remove(key)
+                    return None
+
+                response: str = file_path.read_bytes().decode("utf-8")
+            except FileNotFoundError:
+                self.__size -= self.__entries.pop(key)
+                return None
+
+            # keep the modification time as the entry age, record the access for eviction
+            os.utime(file_path, (time.time(), modified))
+            self.__entries.move_to_end(key)
+
+        return response
+
+    def put(self, url: str, response: str) -> None:
+        """
+        Store `response` for `url`.
+
+        Args:
+            url (str): url.
+            response (str): response.
+        """
+        validate(response, str)
+
+        key: str = self.__key(url)
+        data: bytes = response.encode("utf-8")
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= self.__entries.pop(key)
+
+            (self.__path / key).write_bytes(data)
+
+            self.__entries[key] = len(data)
+            self.__size += len(data)
+
+            self.__evict()
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
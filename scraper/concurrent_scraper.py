@@ -0,0 +1,211 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from types import NoneType
+from typing import Any, Callable, Iterable, Iterator
+from scraper.cache import ResponseCache
+from scraper.journal import Journal
+from scraper.metrics import Metrics
+from scraper.scraper import Scraper
+from validate import validate
+
+
+class ConcurrentScraper(Scraper):
+    @property
+    def max_workers(self) -> int:
+        return self.__max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int) -> None:
+        validate(max_workers, int)
+
+        if max_workers < 1:
+            raise ValueError(f"Expected `max_workers` >= 1, got: '{max_workers}'.")
+
+        self.__max_workers = max_workers
+
+    @max_workers.deleter
+    def max_workers(self) -> None:
+        raise AttributeError("Cannot delete `max_workers`.")
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.__max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, max_in_flight: int | NoneType) -> None:
+        validate(max_in_flight, (int, NoneType))
+
+        if max_in_flight is None:
+            max_in_flight = self.max_workers
+
+        if max_in_flight < 1:
+            raise ValueError(
+                f"Expected `max_in_flight` >= 1, got: '{max_in_flight}'."
+            )
+
+        self.__max_in_flight = max_in_flight
+
+    @max_in_flight.deleter
+    def max_in_flight(self) -> None:
+        raise AttributeError("Cannot delete `max_in_flight`.")
+
+    @property
+    def errors(self) -> dict[int, Exception]:
+        return self.__errors
+
+    @errors.setter
+    def errors(self, errors: dict[int, Exception]) -> None:
+        raise AttributeError("Cannot set `errors`.")
+
+    @errors.deleter
+    def errors(self) -> None:
+        raise AttributeError("Cannot delete `errors`.")
+
+    def __init__(
+        self,
+        url: str | Iterable[str],
+        request_func: Callable[[str], str],
+        scrape_func: Callable[[str], str],
+        max_workers: int = 8,
+        max_in_flight: int | NoneType = None,
+        journal: Journal | str | Path | NoneType = None,
+        cache: ResponseCache | NoneType = None,
+        metrics: Metrics | NoneType = None,
+    ) -> None:
+        """
+        Concurrent scraper.
+
+        Will request and scrape urls on a thread pool. At most `max_in_flight` urls are submitted
+        to the pool at any time, results are returned in the same order as the urls.
+
+        Args:
+            url (str | Iterable[str]): url or urls to scrape.
+            request_func (Callable[[str], str]): function to request html from a url. Expects single str argument and returns str.
+            scrape_func (Callable[[str], str]): function to scrape html. Expects single str argument and returns Any.
+            max_workers (int, optional): number of worker threads. Defaults to 8.
+            max_in_flight (int | NoneType, optional): maximum number of urls submitted but not yet finished.
+                Defaults to None, meaning `max_workers`.
+            journal (Journal | str | Path | NoneType, optional): checkpoint journal, or path of one, used to resume
+                an interrupted run. Defaults to None.
+            cache (ResponseCache | NoneType, optional): cache of responses checked before calling `request_func`.
+                Defaults to None.
+            metrics (Metrics | NoneType, optional): sink for per url request and scrape metrics. Defaults to None.
+        """
+
+        super().__init__(url, request_func, scrape_func)
+
+        self.__max_workers: int = 8
+        self.__max_in_flight: int = 8
+        self.__errors: dict[int, Exception] = {}
+
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.journal = journal
+        self.cache = cache
+        self.metrics = metrics
+
+    def _process(self, i: int, url: str) -> Any:
+        """
+        Request and scrape a single url.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url to process.
+
+        Returns:
+            Any: scraped result.
+        """
+        response = self._request(i, url)
+        return self._scrape(i, url, response)
+
+    def iter_results(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Request and scrape urls on the thread pool, yielding results in completion order.
+
+        Errors raised while processing a url do not abort the run, they are stored in `errors`
+        keyed by the url iteration number and the yielded result for that url is None. If a `journal`
+        is set, urls it records as scraped are not submitted again and their recorded result is yielded
+        instead.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every url is submitted to the pool.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+
+        validate(callback, (Callable, NoneType))
+
+        self.__errors = {}
+
+        in_flight: dict[Future, tuple[int, str]] = {}
+
+        def collect(done: Iterable[Future]) -> Iterator[tuple[int, str, Any]]:
+            for future in done:
+                i, url = in_flight.pop(future)
+
+                try:
+                    result: Any = future.result()
+
+                    # an unpicklable result or a failed journal write is an error of this url
+                    if self.journal is not None:
+                        self.journal.record_scraped(i, url, result)
+                except Exception as e:
+                    self.__errors[i] = e
+
+                    if self.journal is not None:
+                        self.journal.record_failed(i, url)
+
+                    yield i, url, None
+                    continue
+
+                yield i, url, result
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i, url in enumerate(self.iter_urls()):
+                # replay work completed by a previous run
+                if self.journal is not None and self.journal.is_scraped(i, url):
+                    yield i, url, self.journal.result(i)
+                    continue
+
+                # wait for a slot before submitting more work
+                if len(in_flight) >= self.max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from collect(done)
+
+                if callback is not None:
+                    callback(i, url)
+
+                in_flight[executor.submit(self._process, i, url)] = (i, url)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from collect(done)
+
+    def run(self, callback: Callable[[int, str], Any] | NoneType = None) -> list[Any]:
+        """
+        Run the concurrent scraper.
+
+        Errors raised while processing a url do not abort the run, they are stored in `errors`
+        keyed by the url iteration number and the result for that url is None.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every url is submitted to the pool.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Returns:
+            list[Any]: List of results, in url order.
+        """
+
+        results: list[Any] = []
+
+        for i, _, result in self.iter_results(callback):
+            if i >= len(results):
+                results.extend([None] * (i + 1 - len(results)))
+
+            results[i] = result
+
+        return results
@@ -0,0 +1,191 @@
+import base64
+import pickle
+from pathlib import Path
+from threading import Lock
+from types import NoneType
+from typing import Any, TextIO
+from validate import validate
+
+
+def encode_result(result: Any) -> str:
+    """
+    Encode a scraped result as a single journal field.
+
+    Args:
+        result (Any): picklable scraped result.
+
+    Returns:
+        str: base64 encoded pickle, without tabs or newlines.
+    """
+    return base64.b64encode(
+        pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    ).decode("ascii")
+
+
+def decode_result(field: str) -> Any:
+    """
+    Decode a journal field written by `encode_result`.
+
+    Args:
+        field (str): base64 encoded pickle.
+
+    Returns:
+        Any: scraped result.
+    """
+    return pickle.loads(base64.b64decode(field, validate=True))
+
+
+class Journal:
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    def __init__(self, path: str | Path | Any) -> None:
+        """
+        Append-only checkpoint journal.
+
+        Records which url iteration numbers were requested, scraped or failed, one event per line.
+        An existing journal at `path` is loaded so a restarted run can skip completed work.
+        Scraped results are pickled, so a resumed run gets back results of the same types as a fresh run
+        (e.g. `DirectoryRecord`s stay named tuples). They must be picklable, and a journal must only be
+        loaded from a trusted path.
+
+        Args:
+            path (str | Path | Any): path of the journal file.
+        """
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+        self.__requested: dict[int, str] = {}
+        self.__scraped: dict[int, tuple[str, Any]] = {}
+        self.__file: TextIO | NoneType = None
+        self.__lock: Lock = Lock()
+
+        if self.__path.exists():
+            self.__load()
+
+    def __load(self) -> None:
+        with open(self.__path) as journal:
+            for line in journal:
+                parts: list[str] = line.rstrip("\n").split("\t", 3)
+
+                # skip lines cut short by an interrupted write
+                try:
+                    event, i, url = parts[0], int(parts[1]), parts[2]
+
+                    if event == "requested":
+                        self.__requested[i] = url
+                    elif event == "scraped":
+                        self.__scraped[i] = (url, decode_result(parts[3]))
+                    elif event == "failed":
+                        self.__requested.pop(i, None)
+                        self.__scraped.pop(i, None)
+                except (IndexError, ValueError, EOFError, pickle.UnpicklingError):
+                    continue
+
+    def __write(self, *parts: Any) -> None:
+        line: str = "\t".join(str(part) for part in parts) + "\n"
+
+        with self.__lock:
+            if self.__file is None:
+                self.__path.parent.mkdir(parents=True, exist_ok=True)
+                self.__file = open(self.__path, "a", buffering=1)
+
+            self.__file.write(line)
+
+    def is_requested(self, i: int, url: str) -> bool:
+        """
+        Check if `url` was requested as url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+
+        Returns:
+            bool: Whether the request was recorded.
+        """
+        return self.__requested.get(i) == url
+
+    def is_scraped(self, i: int, url: str) -> bool:
+        """
+        Check if `url` was scraped as url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+
+        Returns:
+            bool: Whether the scrape was recorded.
+        """
+        return i in self.__scraped and self.__scraped[i][0] == url
+
+    def result(self, i: int) -> Any:
+        """
+        Get the recorded result of url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            Any: scraped result.
+        """
+        return self.__scraped[i][1]
+
+    def record_requested(self, i: int, url: str) -> None:
+        """
+        Record that `url` was requested as url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+        """
+        validate(i, int)
+        validate(url, str)
+
+        self.__write("requested", i, url)
+        self.__requested[i] = url
+
+    def record_scraped(self, i: int, url: str, result: Any) -> None:
+        """
+        Record that `url` was scraped as url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+            result (Any): picklable scraped result.
+        """
+        validate(i, int)
+        validate(url, str)
+
+        self.__write("scraped", i, url, encode_result(result))
+        self.__scraped[i] = (url, result)
+
+    def record_failed(self, i: int, url: str) -> None:
+        """
+        Record that requesting or scraping `url` failed, so it is redone by the next run.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+        """
+        validate(i, int)
+        validate(url, str)
+
+        self.__write("failed", i, url)
+        self.__requested.pop(i, None)
+        self.__scraped.pop(i, None)
+
+    def close(self) -> None:
+        """
+        Close the journal file.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
@@ -0,0 +1,208 @@
+import json
+import math
+import time
+from pathlib import Path
+from threading import Lock
+from types import NoneType
+from typing import Any, Sized, TextIO
+from validate import validate
+
+
+def percentile(values: list[float], p: float) -> float | NoneType:
+    """
+    Nearest-rank percentile of `values`.
+
+    Args:
+        values (list[float]): sorted values.
+        p (float): percentile, between 0 and 100.
+
+    Returns:
+        float | NoneType: percentile, or None if `values` is empty.
+    """
+    if not values:
+        return None
+
+    rank: int = max(math.ceil(p / 100 * len(values)), 1)
+
+    return values[rank - 1]
+
+
+class Metrics:
+    @property
+    def path(self) -> Path | NoneType:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    def __init__(self, path: str | Path | NoneType = None) -> None:
+        """
+        Per url run metrics.
+
+        Scrapers record one event per request (latency, bytes received) and one per scrape (scrape time,
+        number of results), including errors. Events are appended to `path` as JSON lines and kept in
+        memory for `summary`.
+
+        Args:
+            path (str | Path | NoneType, optional): path of the JSONL metrics file. Defaults to None,
+                meaning metrics are only kept in memory.
+        """
+        validate(path, (str, Path, NoneType))
+
+        self.__path: Path | NoneType = (
+            Path(path) if isinstance(path, str) else path
+        )
+        self.__file: TextIO | NoneType = None
+        self.__lock: Lock = Lock()
+
+        self.__latencies: list[float] = []
+        self.__scrape_times: list[float] = []
+        self.__bytes: int = 0
+        self.__results: int = 0
+        self.__request_errors: int = 0
+        self.__scrape_errors: int = 0
+        self.__start: float | NoneType = None
+        self.__end: float | NoneType = None
+
+    def __write(self, event: dict[str, Any], duration: float) -> None:
+        now: float = time.time()
+
+        # the run starts when the first recorded event started
+        started: float = now - duration
+        self.__start = started if self.__start is None else min(self.__start, started)
+        self.__end = now
+
+        if self.__path is None:
+            return
+
+        if self.__file is None:
+            self.__path.parent.mkdir(parents=True, exist_ok=True)
+            self.__file = open(self.__path, "a")
+
+        self.__file.write(json.dumps({"time": now, **event}) + "\n")
+
+    def record_request(
+        self,
+        i: int,
+        url: str,
+        latency: float,
+        response: str | NoneType = None,
+        error: BaseException | NoneType = None,
+    ) -> None:
+        """
+        Record a request.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+            latency (float): seconds the request took.
+            response (str | NoneType, optional): response received. Defaults to None.
+            error (BaseException | NoneType, optional): error raised by the request. Defaults to None.
+        """
+        size: int = len(response.encode("utf-8")) if response is not None else 0
+
+        with self.__lock:
+            self.__latencies.append(latency)
+            self.__bytes += size
+
+            if error is not None:
+                self.__request_errors += 1
+
+            self.__write(
+                {
+                    "stage": "request",
+                    "i": i,
+                    "url": url,
+                    "latency": latency,
+                    "bytes": size,
+                    "error": repr(error) if error is not None else None,
+                },
+                latency,
+            )
+
+    def record_scrape(
+        self,
+        i: int,
+        url: str,
+        duration: float,
+        result: Any = None,
+        error: BaseException | NoneType = None,
+    ) -> None:
+        """
+        Record a scrape.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url.
+            duration (float): seconds the scrape took.
+            result (Any, optional): scraped result, its length is recorded if it has one. Defaults to None.
+            error (BaseException | NoneType, optional): error raised by the scrape. Defaults to None.
+        """
+        count: int | NoneType = len(result) if isinstance(result, Sized) else None
+
+        with self.__lock:
+            self.__scrape_times.append(duration)
+            self.__results += count or 0
+
+            if error is not None:
+                self.__scrape_errors += 1
+
+            self.__write(
+                {
+                    "stage": "scrape",
+                    "i": i,
+                    "url": url,
+                    "duration": duration,
+                    "results": count,
+                    "error": repr(error) if error is not None else None,
+                },
+                duration,
+            )
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarize the recorded metrics.
+
+        Returns:
+            dict[str, Any]: request and scrape counts, errors, bytes received, number of results,
+                p50/p95/p99 request latency and scrape time in seconds, total scrape time, and throughput.
+        """
+        with self.__lock:
+            latencies: list[float] = sorted(self.__latencies)
+            scrape_times: list[float] = sorted(self.__scrape_times)
+            elapsed: float = (
+                self.__end - self.__start if self.__start is not None else 0.0
+            )
+
+            return {
+                "requests": len(latencies),
+                "request_errors": self.__request_errors,
+                "scrapes": len(scrape_times),
+                "scrape_errors": self.__scrape_errors,
+                "bytes": self.__bytes,
+                "results": self.__results,
+                "request_latency": {
+                    f"p{p}": percentile(latencies, p) for p in (50, 95, 99)
+                },
+                "scrape_time": {
+                    f"p{p}": percentile(scrape_times, p) for p in (50, 95, 99)
+                },
+                "scrape_seconds": sum(scrape_times),
+                "elapsed": elapsed,
+                "requests_per_second": len(latencies) / elapsed if elapsed else None,
+                "bytes_per_second": self.__bytes / elapsed if elapsed else None,
+            }
+
+    def close(self) -> None:
+        """
+        Close the metrics file.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
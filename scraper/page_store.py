@@ -0,0 +1,471 @@
+import hashlib
+import mmap
+import zlib
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from types import NoneType
+from typing import Any, BinaryIO, Callable, ContextManager, Iterator, TextIO
+from validate import validate
+
+_CODECS: tuple[str, ...] = ("auto", "zstd", "zlib", "none")
+
+
+def _zstd() -> Any:
+    """
+    Import the optional `zstandard` package.
+
+    Returns:
+        Any: `zstandard` module, or None if it is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        return None
+
+    return zstandard
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return _zstd().ZstdCompressor().compress(data)
+
+    if codec == "zlib":
+        return zlib.compress(data)
+
+    return data
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return _zstd().ZstdDecompressor().decompress(data)
+
+    if codec == "zlib":
+        return zlib.decompress(data)
+
+    return data
+
+
+def _read_blob(pack_path: Path, offset: int, length: int, codec: str) -> str:
+    """
+    Read a page from a pack file. Used to load pages in worker processes.
+
+    Args:
+        pack_path (Path): path of the pack file.
+        offset (int): offset of the compressed page.
+        length (int): length of the compressed page.
+        codec (str): codec the page was compressed with.
+
+    Returns:
+        str: html.
+    """
+    with open(pack_path, "rb") as pack:
+        pack.seek(offset)
+
+        return _decompress(pack.read(length), codec).decode("utf-8")
+
+
+@contextmanager
+def _map_blob(
+    path: Path, offset: int = 0, length: int | NoneType = None, codec: str = "none"
+) -> Iterator[bytes | memoryview | mmap.mmap]:
+    """
+    Map a stored page into memory. Used to view pages in worker processes as well.
+
+    Uncompressed pages are memory mapped and not copied, compressed pages can not be mapped and are
+    decompressed into `bytes`.
+
+    Args:
+        path (Path): path of the file holding the page.
+        offset (int, optional): offset of the page. Defaults to 0.
+        length (int | NoneType, optional): length of the page. Defaults to None, meaning until the end of the file.
+        codec (str, optional): codec the page was compressed with. Defaults to "none".
+
+    Yields:
+        Iterator[bytes | memoryview | mmap.mmap]: page bytes.
+    """
+    with open(path, "rb") as file:
+        if length is None:
+            length = file.seek(0, 2) - offset
+
+        if codec != "none":
+            file.seek(offset)
+            yield _decompress(file.read(length), codec)
+            return
+
+        # empty files can not be mapped
+        if length == 0:
+            yield b""
+            return
+
+        # mappings must start at a multiple of the allocation granularity
+        start: int = offset - offset % mmap.ALLOCATIONGRANULARITY
+        mapped: mmap.mmap = mmap.mmap(
+            file.fileno(), offset - start + length, offset=start, access=mmap.ACCESS_READ
+        )
+        view: memoryview | mmap.mmap = (
+            memoryview(mapped)[offset - start :] if offset != start else mapped
+        )
+
+        try:
+            yield view
+        finally:
+            if isinstance(view, memoryview):
+                view.release()
+
+            try:
+                mapped.close()
+            except BufferError:
+                # the scrape function kept a view of the page, the mapping is closed once it is collected
+                pass
+
+
+class PageStore:
+    def put(self, i: int, html: str) -> None:
+        """
+        Store the html of url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+            html (str): html.
+        """
+        raise NotImplementedError("`put()` must be implemented.")
+
+    def get(self, i: int) -> str:
+        """
+        Read the html of url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            str: html.
+        """
+        return self.loader(i)()
+
+    def loader(self, i: int) -> Callable[[], str]:
+        """
+        Picklable function reading the html of url iteration number `i`, so worker processes can
+        read stored pages themselves.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            Callable[[], str]: function returning the html.
+        """
+        raise NotImplementedError("`loader()` must be implemented.")
+
+    def view(self, i: int) -> ContextManager[bytes | memoryview | mmap.mmap]:
+        """
+        View the html of url iteration number `i` as bytes without decoding it, memory mapped when possible.
+
+        The view is only valid inside the `with` block.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            ContextManager[bytes | memoryview | mmap.mmap]: context manager yielding the utf-8 encoded html.
+        """
+        return self.mapper(i)()
+
+    def mapper(self, i: int) -> Callable[[], ContextManager[bytes | memoryview | mmap.mmap]]:
+        """
+        Picklable function viewing the html of url iteration number `i`, see `view` and `loader`.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            Callable[[], ContextManager[bytes | memoryview | mmap.mmap]]: function returning the view.
+        """
+        raise NotImplementedError("`mapper()` must be implemented.")
+
+    def contains(self, i: int) -> bool:
+        """
+        Check if the html of url iteration number `i` is stored.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            bool: Whether the html is stored.
+        """
+        raise NotImplementedError("`contains()` must be implemented.")
+
+    def indexes(self) -> list[int]:
+        """
+        Url iteration numbers with a stored page.
+
+        Returns:
+            list[int]: sorted url iteration numbers.
+        """
+        raise NotImplementedError("`indexes()` must be implemented.")
+
+    def delete(self, i: int) -> None:
+        """
+        Delete the html of url iteration number `i`, if it is stored.
+
+        Args:
+            i (int): url iteration number.
+        """
+        raise NotImplementedError("`delete()` must be implemented.")
+
+    def clear(self) -> None:
+        """
+        Delete every stored page.
+        """
+        raise NotImplementedError("`clear()` must be implemented.")
+
+
+class FileStore(PageStore):
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    def __init__(self, path: str | Path | Any) -> None:
+        """
+        Page store keeping every page in its own `{path}/{i}.html` file.
+
+        Args:
+            path (str | Path | Any): directory to store pages in.
+        """
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+        self.__path.mkdir(parents=True, exist_ok=True)
+
+    def file_path(self, i: int) -> Path:
+        """
+        Path of the stored html for url iteration number `i`.
+
+        Args:
+            i (int): url iteration number.
+
+        Returns:
+            Path: file path.
+        """
+        return Path(f"{self.path}/{i}.html")
+
+    def put(self, i: int, html: str) -> None:
+        self.file_path(i).write_text(html, encoding="utf-8")
+
+    def loader(self, i: int) -> Callable[[], str]:
+        return partial(Path.read_text, self.file_path(i), encoding="utf-8")
+
+    def mapper(self, i: int) -> Callable[[], ContextManager[bytes | memoryview | mmap.mmap]]:
+        return partial(_map_blob, self.file_path(i))
+
+    def contains(self, i: int) -> bool:
+        return self.file_path(i).exists()
+
+    def indexes(self) -> list[int]:
+        return sorted(
+            int(file_path.stem)
+            for file_path in self.path.glob("*.html")
+            if file_path.stem.isdigit()
+        )
+
+    def delete(self, i: int) -> None:
+        self.file_path(i).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for file_path in self.path.glob("*.html"):
+            if file_path.stem.isdigit():
+                file_path.unlink(missing_ok=True)
+
+
+class PackStore(PageStore):
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    @property
+    def codec(self) -> str:
+        return self.__codec
+
+    @codec.setter
+    def codec(self, codec: str) -> None:
+        raise AttributeError("Cannot set `codec`.")
+
+    @codec.deleter
+    def codec(self) -> None:
+        raise AttributeError("Cannot delete `codec`.")
+
+    @property
+    def blobs(self) -> int:
+        return len(self.__blobs)
+
+    @blobs.setter
+    def blobs(self, blobs: int) -> None:
+        raise AttributeError("Cannot set `blobs`.")
+
+    @blobs.deleter
+    def blobs(self) -> None:
+        raise AttributeError("Cannot delete `blobs`.")
+
+    def __init__(self, path: str | Path | Any, compression: str = "auto") -> None:
+        """
+        Content addressed page store keeping every page in a single append-only pack file.
+
+        Pages are identified by the sha256 of their html, so identical pages (e.g. every "no results"
+        page) are stored once, and compressed. The pack file `{path}/pages.pack` holds the compressed
+        pages and `{path}/pages.idx` records where each page is and which url iteration numbers use it,
+        one event per line. An existing pack is loaded so a restarted run keeps its stored pages.
+
+        Args:
+            path (str | Path | Any): directory to store the pack in.
+            compression (str, optional): "zstd" (requires the `zstandard` package), "zlib", "none", or
+                "auto" meaning zstd if `zstandard` is installed, zlib otherwise. Defaults to "auto".
+        """
+        validate(compression, str)
+
+        if compression not in _CODECS:
+            raise ValueError(
+                f"Expected `compression` in {_CODECS}, got: '{compression}'."
+            )
+
+        if compression == "auto":
+            compression = "zstd" if _zstd() is not None else "zlib"
+        elif compression == "zstd" and _zstd() is None:
+            raise ImportError("`compression='zstd'` requires the `zstandard` package.")
+
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+        self.__path.mkdir(parents=True, exist_ok=True)
+        self.__codec: str = compression
+
+        # digest -> (offset, length, codec) of the compressed page, i -> digest
+        self.__blobs: dict[str, tuple[int, int, str]] = {}
+        self.__pages: dict[int, str] = {}
+        self.__end: int = 0
+
+        self.__pack: BinaryIO | NoneType = None
+        self.__index: TextIO | NoneType = None
+        self.__lock: Lock = Lock()
+
+        if self.__index_path().exists():
+            self.__load()
+
+    def __pack_path(self) -> Path:
+        return Path(f"{self.path}/pages.pack")
+
+    def __index_path(self) -> Path:
+        return Path(f"{self.path}/pages.idx")
+
+    def __load(self) -> None:
+        size: int = (
+            self.__pack_path().stat().st_size if self.__pack_path().exists() else 0
+        )
+
+        with open(self.__index_path()) as index:
+            for line in index:
+                parts: list[str] = line.rstrip("\n").split("\t")
+
+                # skip lines cut short by an interrupted write
+                try:
+                    if parts[0] == "blob":
+                        offset, length = int(parts[2]), int(parts[3])
+
+                        if offset + length <= size and parts[4] in _CODECS:
+                            self.__blobs[parts[1]] = (offset, length, parts[4])
+                            self.__end = max(self.__end, offset + length)
+                    elif parts[0] == "page" and parts[2] in self.__blobs:
+                        self.__pages[int(parts[1])] = parts[2]
+                    elif parts[0] == "drop":
+                        self.__pages.pop(int(parts[1]), None)
+                except (IndexError, ValueError):
+                    continue
+
+    def __open(self) -> None:
+        if self.__pack is None:
+            self.__pack = open(self.__pack_path(), "ab")
+            # drop a page cut short by an interrupted write
+            self.__pack.truncate(self.__end)
+            self.__index = open(self.__index_path(), "a", buffering=1)
+
+    def put(self, i: int, html: str) -> None:
+        data: bytes = html.encode("utf-8")
+        digest: str = hashlib.sha256(data).hexdigest()
+
+        with self.__lock:
+            self.__open()
+
+            if digest not in self.__blobs:
+                blob: bytes = _compress(data, self.__codec)
+
+                # the page is written before the index line referencing it
+                self.__pack.write(blob)
+                self.__pack.flush()
+
+                self.__blobs[digest] = (self.__end, len(blob), self.__codec)
+                self.__index.write(
+                    f"blob\t{digest}\t{self.__end}\t{len(blob)}\t{self.__codec}\n"
+                )
+                self.__end += len(blob)
+
+            self.__pages[i] = digest
+            self.__index.write(f"page\t{i}\t{digest}\n")
+
+    def loader(self, i: int) -> Callable[[], str]:
+        with self.__lock:
+            offset, length, codec = self.__blobs[self.__pages[i]]
+
+        return partial(_read_blob, self.__pack_path(), offset, length, codec)
+
+    def mapper(self, i: int) -> Callable[[], ContextManager[bytes | memoryview | mmap.mmap]]:
+        with self.__lock:
+            offset, length, codec = self.__blobs[self.__pages[i]]
+
+        return partial(_map_blob, self.__pack_path(), offset, length, codec)
+
+    def contains(self, i: int) -> bool:
+        return i in self.__pages
+
+    def indexes(self) -> list[int]:
+        with self.__lock:
+            return sorted(self.__pages)
+
+    def delete(self, i: int) -> None:
+        with self.__lock:
+            if self.__pages.pop(i, None) is None:
+                return
+
+            self.__open()
+            self.__index.write(f"drop\t{i}\n")
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.close()
+
+            self.__pack_path().unlink(missing_ok=True)
+            self.__index_path().unlink(missing_ok=True)
+
+            self.__blobs.clear()
+            self.__pages.clear()
+            self.__end = 0
+
+    def close(self) -> None:
+        """
+        Close the pack and index files.
+        """
+        if self.__pack is not None:
+            self.__pack.close()
+            self.__index.close()
+            self.__pack = None
+            self.__index = None
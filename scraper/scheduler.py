@@ -0,0 +1,305 @@
+import random
+import time
+from http.client import HTTPException
+from threading import Condition, Lock
+from types import NoneType
+from typing import Any, Callable
+from validate import validate
+
+
+def retry_after(error: BaseException) -> float | NoneType:
+    """
+    Seconds a server asked to wait before retrying, from the `Retry-After` header of an HTTP error.
+
+    Args:
+        error (BaseException): error raised by a request, e.g. `urllib.error.HTTPError`.
+
+    Returns:
+        float | NoneType: seconds to wait, or None if the server did not say.
+    """
+    headers: Any = getattr(error, "headers", None)
+    value: Any = headers.get("Retry-After") if headers is not None else None
+
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Check if a request error is worth retrying.
+
+    Network errors and HTTP status 429 and 5xx are retried, other HTTP statuses (e.g. 404) are not.
+
+    Args:
+        error (BaseException): error raised by a request.
+
+    Returns:
+        bool: Whether to retry.
+    """
+    status: Any = getattr(error, "code", None)
+
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+
+    return isinstance(error, (OSError, HTTPException))
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Token bucket rate limit, allowing `rate` calls per second on average and up to `burst` at once.
+
+        Args:
+            rate (float): tokens added per second.
+            burst (int, optional): maximum number of tokens. Defaults to 1.
+        """
+        validate(rate, (int, float))
+        validate(burst, int)
+
+        if rate <= 0 or burst < 1:
+            raise ValueError(
+                f"Expected `rate` > 0 and `burst` >= 1, got: '{rate}', '{burst}'."
+            )
+
+        self.__rate: float = float(rate)
+        self.__burst: int = burst
+        self.__tokens: float = float(burst)
+        self.__updated: float = time.monotonic()
+        self.__lock: Lock = Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting for one if the bucket is empty.
+
+        Returns:
+            float: seconds waited.
+        """
+        waited: float = 0.0
+
+        while True:
+            with self.__lock:
+                now: float = time.monotonic()
+                self.__tokens = min(
+                    self.__tokens + (now - self.__updated) * self.__rate, self.__burst
+                )
+                self.__updated = now
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return waited
+
+                wait: float = (1 - self.__tokens) / self.__rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+class RequestScheduler:
+    @property
+    def limit(self) -> int:
+        return int(self.__limit)
+
+    @limit.setter
+    def limit(self, limit: int) -> None:
+        raise AttributeError("Cannot set `limit`.")
+
+    @limit.deleter
+    def limit(self) -> None:
+        raise AttributeError("Cannot delete `limit`.")
+
+    @property
+    def retries(self) -> int:
+        return self.__retries
+
+    @retries.setter
+    def retries(self, retries: int) -> None:
+        raise AttributeError("Cannot set `retries`.")
+
+    @retries.deleter
+    def retries(self) -> None:
+        raise AttributeError("Cannot delete `retries`.")
+
+    @property
+    def throttled(self) -> float:
+        return self.__throttled
+
+    @throttled.setter
+    def throttled(self, throttled: float) -> None:
+        raise AttributeError("Cannot set `throttled`.")
+
+    @throttled.deleter
+    def throttled(self) -> None:
+        raise AttributeError("Cannot delete `throttled`.")
+
+    def __init__(
+        self,
+        request_func: Callable[[str], str],
+        rate: float | NoneType = None,
+        burst: int = 1,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        min_concurrency: int = 1,
+        max_concurrency: int = 8,
+        latency_target: float | NoneType = None,
+        decrease_interval: float = 3.0,
+        retryable: Callable[[BaseException], bool] = is_retryable,
+    ) -> None:
+        """
+        Request scheduler wrapping a `request_func`. `request` can be used as the `request_func` of any scraper.
+
+        Every request first takes a token from a token bucket allowing `rate` requests per second, then waits
+        for one of `limit` concurrency slots. The limit adapts AIMD style: it grows by about one per `limit`
+        successful requests, and halves (at most once per `decrease_interval` seconds) when a request fails or
+        takes longer than `latency_target`, so parallel scrapers settle at the rate the server sustains.
+
+        A failed request is retried up to `max_retries` times per url, after a jittered exponential backoff
+        of up to `backoff * 2**attempt` seconds, or the server's `Retry-After` if it sent one. The last error
+        is raised once the retries of a url are used up.
+
+        Args:
+            request_func (Callable[[str], str]): function to request html from a url.
+            rate (float | NoneType, optional): requests per second. Defaults to None, meaning no rate limit.
+            burst (int, optional): requests allowed at once above `rate`. Defaults to 1.
+            max_retries (int, optional): retries per url. Defaults to 3.
+            backoff (float, optional): backoff of the first retry in seconds. Defaults to 0.5.
+            max_backoff (float, optional): maximum backoff in seconds. Defaults to 30.0.
+            min_concurrency (int, optional): lower bound of the concurrency limit. Defaults to 1.
+            max_concurrency (int, optional): upper bound and start of the concurrency limit. Defaults to 8.
+            latency_target (float | NoneType, optional): request seconds above which the server is treated as
+                overloaded. Defaults to None, meaning only errors lower the limit.
+            decrease_interval (float, optional): minimum seconds between two halvings of the limit, so a burst of
+                failures halves it once. Defaults to 3.0.
+            retryable (Callable[[BaseException], bool], optional): check if an error is worth retrying.
+                Defaults to `is_retryable`.
+        """
+        validate(request_func, Callable)
+        validate(rate, (int, float, NoneType))
+        validate(burst, int)
+        validate(max_retries, int)
+        validate(backoff, (int, float))
+        validate(max_backoff, (int, float))
+        validate(min_concurrency, int)
+        validate(max_concurrency, int)
+        validate(latency_target, (int, float, NoneType))
+        validate(decrease_interval, (int, float))
+        validate(retryable, Callable)
+
+        if max_retries < 0:
+            raise ValueError(f"Expected `max_retries` >= 0, got: '{max_retries}'.")
+
+        if decrease_interval < 0:
+            raise ValueError(
+                f"Expected `decrease_interval` >= 0, got: '{decrease_interval}'."
+            )
+
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Expected 1 <= `min_concurrency` <= `max_concurrency`, got: '{min_concurrency}', '{max_concurrency}'."
+            )
+
+        self.__request_func: Callable[[str], str] = request_func
+        self.__bucket: TokenBucket | NoneType = (
+            TokenBucket(rate, burst) if rate is not None else None
+        )
+        self.__max_retries: int = max_retries
+        self.__backoff: float = float(backoff)
+        self.__max_backoff: float = float(max_backoff)
+        self.__min_concurrency: int = min_concurrency
+        self.__max_concurrency: int = max_concurrency
+        self.__latency_target: float | NoneType = latency_target
+        self.__decrease_interval: float = float(decrease_interval)
+        self.__retryable: Callable[[BaseException], bool] = retryable
+
+        self.__limit: float = float(max_concurrency)
+        self.__in_flight: int = 0
+        self.__decreased: float = 0.0
+        self.__retries: int = 0
+        self.__throttled: float = 0.0
+        self.__condition: Condition = Condition()
+
+    def __enter_slot(self) -> None:
+        with self.__condition:
+            while self.__in_flight >= int(self.__limit):
+                self.__condition.wait()
+
+            self.__in_flight += 1
+
+    def __leave_slot(self, overloaded: bool) -> None:
+        with self.__condition:
+            self.__in_flight -= 1
+            now: float = time.monotonic()
+
+            if not overloaded:
+                # additive increase, about one slot per `limit` successful requests
+                self.__limit = min(
+                    self.__limit + 1 / self.__limit, self.__max_concurrency
+                )
+            elif now - self.__decreased >= self.__decrease_interval:
+                # multiplicative decrease, once per burst of failures
+                self.__limit = max(self.__limit / 2, self.__min_concurrency)
+                self.__decreased = now
+
+            self.__condition.notify_all()
+
+    def __sleep(self, attempt: int, error: BaseException) -> None:
+        delay: float | NoneType = retry_after(error)
+
+        if delay is None:
+            # full jitter, so retries of parallel requests do not line up
+            delay = random.uniform(0, self.__backoff * 2**attempt)
+
+        delay = min(delay, self.__max_backoff)
+
+        with self.__condition:
+            self.__retries += 1
+            self.__throttled += delay
+
+        time.sleep(delay)
+
+    def request(self, url: str) -> str:
+        """
+        Request `url` with `request_func`, rate limited and retried.
+
+        Args:
+            url (str): url to request.
+
+        Returns:
+            str: html.
+        """
+        attempt: int = 0
+
+        while True:
+            if self.__bucket is not None:
+                waited: float = self.__bucket.acquire()
+
+                with self.__condition:
+                    self.__throttled += waited
+
+            self.__enter_slot()
+            start: float = time.perf_counter()
+
+            try:
+                response: str = self.__request_func(url)
+            except Exception as e:
+                retry: bool = self.__retryable(e)
+
+                # only errors pointing at an overloaded server lower the limit, e.g. not a 404
+                self.__leave_slot(overloaded=retry)
+
+                if attempt >= self.__max_retries or not retry:
+                    raise
+
+                self.__sleep(attempt, e)
+                attempt += 1
+                continue
+
+            latency: float = time.perf_counter() - start
+            self.__leave_slot(
+                overloaded=self.__latency_target is not None
+                and latency > self.__latency_target
+            )
+
+            return response
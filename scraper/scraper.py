@@ -1,5 +1,15 @@
-from validate import validate, validate_iterable, validate_option
-from typing import Any, Callable, Iterable
+import time
+from pathlib import Path
+from types import NoneType
+from scraper.cache import ResponseCache
+from scraper.journal import Journal
+from scraper.metrics import Metrics
+from validate import validate, validate_option
+from validate.vval import compile_validator, is_iterable
+from typing import Any, Callable, Iterable, Iterator
+
+# compiled once, every url is validated as it is consumed
+_validate_url = compile_validator(str, "url")
 
 
 class Scraper:
@@ -12,8 +22,13 @@ class Scraper:
         if isinstance(urls, str):
             self.__urls = [urls]
         else:
-            validate_iterable(urls, str)
+            if not is_iterable(urls):
+                raise TypeError(
+                    f"Expected 'str' or 'Iterable' for `urls`, got: '{type(urls).__name__}'."
+                )
 
+            # every url is validated once, in `iter_urls` as it is consumed, so lazy sources
+            # (generators, iterators) are not used up here
             self.__urls = urls
 
     @urls.deleter
@@ -48,6 +63,51 @@ class Scraper:
     def scrape_func(self) -> None:
         raise AttributeError("Cannot delete `scrape_func`.")
 
+    @property
+    def journal(self) -> Journal | NoneType:
+        return self.__journal
+
+    @journal.setter
+    def journal(self, journal: Journal | str | Path | NoneType) -> None:
+        validate(journal, (Journal, str, Path, NoneType))
+
+        if isinstance(journal, (str, Path)):
+            journal = Journal(journal)
+
+        self.__journal = journal
+
+    @journal.deleter
+    def journal(self) -> None:
+        self.__journal = None
+
+    @property
+    def cache(self) -> ResponseCache | NoneType:
+        return self.__cache
+
+    @cache.setter
+    def cache(self, cache: ResponseCache | NoneType) -> None:
+        validate(cache, (ResponseCache, NoneType))
+
+        self.__cache = cache
+
+    @cache.deleter
+    def cache(self) -> None:
+        self.__cache = None
+
+    @property
+    def metrics(self) -> Metrics | NoneType:
+        return self.__metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Metrics | NoneType) -> None:
+        validate(metrics, (Metrics, NoneType))
+
+        self.__metrics = metrics
+
+    @metrics.deleter
+    def metrics(self) -> None:
+        self.__metrics = None
+
     def __init__(
         self,
         url: str | Iterable[str],
@@ -66,10 +126,144 @@ class Scraper:
         self.__urls: Iterable[str] = []
         self.__request_func: Callable[[str], str] = None
         self.__scraper_func: Callable[[str], Any] = None
+        self.__journal: Journal | NoneType = None
+        self.__cache: ResponseCache | NoneType = None
+        self.__metrics: Metrics | NoneType = None
 
         self.urls = url
         self.request_func = request_func
         self.scrape_func = scrape_func
 
+    def request(self, url: str) -> str:
+        """
+        Request `url` with `request_func`, going through `cache` if one is set.
+
+        Args:
+            url (str): url to request.
+
+        Returns:
+            str: response.
+        """
+        if self.cache is None:
+            return self.request_func(url)
+
+        response: str | NoneType = self.cache.get(url)
+
+        if response is None:
+            response = self.request_func(url)
+            self.cache.put(url, response)
+
+        return response
+
+    def _request(self, i: int, url: str) -> str:
+        """
+        Request `url` with `request`, recording the request in `metrics` if set.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url to request.
+
+        Returns:
+            str: response.
+        """
+        if self.metrics is None:
+            return self.request(url)
+
+        start: float = time.perf_counter()
+
+        try:
+            response: str = self.request(url)
+        except Exception as e:
+            self.metrics.record_request(i, url, time.perf_counter() - start, error=e)
+            raise
+
+        self.metrics.record_request(i, url, time.perf_counter() - start, response)
+
+        return response
+
+    def _scrape(self, i: int, url: str, response: str) -> Any:
+        """
+        Scrape `response` with `scrape_func`, recording the scrape in `metrics` if set.
+
+        Args:
+            i (int): url iteration number.
+            url (str): url the response belongs to.
+            response (str): response to scrape.
+
+        Returns:
+            Any: scraped result.
+        """
+        if self.metrics is None:
+            return self.scrape_func(response)
+
+        start: float = time.perf_counter()
+
+        try:
+            result: Any = self.scrape_func(response)
+        except Exception as e:
+            self.metrics.record_scrape(i, url, time.perf_counter() - start, error=e)
+            raise
+
+        self.metrics.record_scrape(i, url, time.perf_counter() - start, result)
+
+        return result
+
+    def iter_urls(self) -> Iterator[str]:
+        """
+        Iterate over `urls`, validating every url as it is consumed.
+
+        Lazy sources such as generators are only iterated once, so a one-shot
+        iterator can only be scraped by a single run.
+
+        Yields:
+            Iterator[str]: url.
+        """
+        for url in self.__urls:
+            _validate_url(url)
+
+            yield url
+
+    def iter_results(
+        self, callback: Callable[[int, str], Any] | NoneType = None
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Lazily request and scrape every url, yielding results as each page finishes.
+
+        Subclasses override this to stream results from their own engine, the default
+        requests and scrapes urls one at a time. If a `journal` is set, urls it records as
+        scraped are not requested again and their recorded result is yielded instead.
+
+        Args:
+            callback (Callable[[int, str], Any] | NoneType, optional): Called before every url is requested.
+                It is called with the current url iteration number and the url. Defaults to None.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+        validate(callback, (Callable, NoneType))
+
+        for i, url in enumerate(self.iter_urls()):
+            # replay work completed by a previous run
+            if self.journal is not None and self.journal.is_scraped(i, url):
+                yield i, url, self.journal.result(i)
+                continue
+
+            if callback is not None:
+                callback(i, url)
+
+            try:
+                response = self._request(i, url)
+                scraped: Any = self._scrape(i, url, response)
+            except Exception:
+                if self.journal is not None:
+                    self.journal.record_failed(i, url)
+
+                raise
+
+            if self.journal is not None:
+                self.journal.record_scraped(i, url, scraped)
+
+            yield i, url, scraped
+
     def run(self) -> Any:
         raise NotImplementedError("`run()` must be implemented.")
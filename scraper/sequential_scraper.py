@@ -1,6 +1,10 @@
+from pathlib import Path
+from types import NoneType
 from typing import Any, Callable, Iterable
+from scraper.cache import ResponseCache
+from scraper.journal import Journal
+from scraper.metrics import Metrics
 from scraper.scraper import Scraper
-from validate import validate
 
 
 class SequentialScraper(Scraper):
@@ -9,6 +13,9 @@ class SequentialScraper(Scraper):
         url: str | Iterable[str],
         request_func: Callable[[str], str],
         scrape_func: Callable[[str], str],
+        journal: Journal | str | Path | NoneType = None,
+        cache: ResponseCache | NoneType = None,
+        metrics: Metrics | NoneType = None,
     ) -> None:
         """
         Sequential scraper.
@@ -19,10 +26,19 @@ class SequentialScraper(Scraper):
             url (str | Iterable[str]): url or urls to scrape.
             request_func (Callable[[str], str]): function to request html from a url. Expects single str argument and returns str.
             scrape_func (Callable[[str], str]): function to scrape html. Expects single str argument and returns Any.
+            journal (Journal | str | Path | NoneType, optional): checkpoint journal, or path of one, used to resume
+                an interrupted run. Defaults to None.
+            cache (ResponseCache | NoneType, optional): cache of responses checked before calling `request_func`.
+                Defaults to None.
+            metrics (Metrics | NoneType, optional): sink for per url request and scrape metrics. Defaults to None.
         """
 
         super().__init__(url, request_func, scrape_func)
 
+        self.journal = journal
+        self.cache = cache
+        self.metrics = metrics
+
     def run(self, callback: Callable[[int, str], Any] = None) -> list[Any]:
         """
         Run the sequential scraper.
@@ -35,22 +51,11 @@ class SequentialScraper(Scraper):
             list[Any]: List of results.
         """
 
-        # validate that callback is a callable
-        validate(callback, Callable)
-
         # create a list to store the results
         results: list[Any] = []
 
-        # loop through the urls
-        for i, url in enumerate(self.urls):
-            # if a callback is provided, call it
-            if callback is not None:
-                callback(i, url)
-
-            # request the url and scrape the response
-            response = self.request_func(url)
-            scraped: Any = self.scrape_func(response)
-
+        # request and scrape the urls one at a time
+        for _, _, scraped in self.iter_results(callback):
             print(scraped)
 
             results.append(scraped)
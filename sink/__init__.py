@@ -0,0 +1,3 @@
+from sink.dedup import BloomIndex, DedupSink, SeenIndex, SetIndex, SQLiteIndex
+from sink.incremental import SweepState, fingerprint
+from sink.store import ResultStore, StoredRecord
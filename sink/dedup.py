@@ -0,0 +1,274 @@
+import hashlib
+import math
+import mmap
+import sqlite3
+from pathlib import Path
+from types import NoneType
+from typing import Any, Iterable, Iterator, TextIO
+from validate import validate
+
+
+class SeenIndex:
+    def add(self, key: str) -> bool:
+        """
+        Add `key` to the index.
+
+        Args:
+            key (str): key.
+
+        Returns:
+            bool: Whether `key` was not in the index yet.
+        """
+        raise NotImplementedError("`add()` must be implemented.")
+
+    def close(self) -> None:
+        """
+        Release the resources held by the index.
+        """
+        pass
+
+
+class SetIndex(SeenIndex):
+    def __init__(self) -> None:
+        """
+        In memory hash set index.
+        """
+        self.__seen: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.__seen)
+
+    def add(self, key: str) -> bool:
+        if key in self.__seen:
+            return False
+
+        self.__seen.add(key)
+
+        return True
+
+
+class BloomIndex(SeenIndex):
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        path: str | Path | NoneType = None,
+    ) -> None:
+        """
+        Bloom filter index.
+
+        Uses a fixed amount of memory for up to `capacity` keys, at the cost of treating a new key as
+        seen with probability `error_rate`. With `path` the bits live in a memory mapped file, so
+        the filter survives between runs.
+
+        Args:
+            capacity (int, optional): expected number of keys. Defaults to 1_000_000.
+            error_rate (float, optional): false positive probability at `capacity` keys. Defaults to 0.001.
+            path (str | Path | NoneType, optional): file to keep the bits in. Defaults to None, meaning memory.
+        """
+        validate(capacity, int)
+        validate(error_rate, float)
+        validate(path, (str, Path, NoneType))
+
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError(
+                f"Expected `capacity` >= 1 and 0 < `error_rate` < 1, got: '{capacity}', '{error_rate}'."
+            )
+
+        self.__size: int = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.__hashes: int = max(round(self.__size / capacity * math.log(2)), 1)
+        length: int = (self.__size + 7) // 8
+
+        self.__file: Any = None
+
+        if path is None:
+            self.__bits: bytearray | mmap.mmap = bytearray(length)
+        else:
+            path = Path(path)
+            self.__file = open(path, "r+b" if path.exists() else "w+b")
+
+            if self.__file.seek(0, 2) != length:
+                self.__file.truncate(length)
+
+            self.__bits = mmap.mmap(self.__file.fileno(), length)
+
+    def add(self, key: str) -> bool:
+        digest: bytes = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+
+        new: bool = False
+
+        # double hashing: bit k is (first + k * second) mod size
+        for k in range(self.__hashes):
+            bit: int = (first + k * second) % self.__size
+            byte, mask = bit >> 3, 1 << (bit & 7)
+
+            if not self.__bits[byte] & mask:
+                self.__bits[byte] |= mask
+                new = True
+
+        return new
+
+    def close(self) -> None:
+        if self.__file is not None:
+            self.__bits.flush()
+            self.__bits.close()
+            self.__file.close()
+            self.__file = None
+
+
+class SQLiteIndex(SeenIndex):
+    def __init__(self, path: str | Path, batch_size: int = 1000) -> None:
+        """
+        On disk SQLite index, exact and persistent between runs.
+
+        Args:
+            path (str | Path): database file.
+            batch_size (int, optional): number of inserts per transaction. Defaults to 1000.
+        """
+        validate(path, (str, Path))
+        validate(batch_size, int)
+
+        self.__connection: sqlite3.Connection = sqlite3.connect(path)
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.__batch_size: int = batch_size
+        self.__pending: int = 0
+
+    def add(self, key: str) -> bool:
+        cursor: sqlite3.Cursor = self.__connection.execute(
+            "INSERT OR IGNORE INTO seen (key) VALUES (?)", (key,)
+        )
+
+        self.__pending += 1
+
+        if self.__pending >= self.__batch_size:
+            self.__connection.commit()
+            self.__pending = 0
+
+        return cursor.rowcount == 1
+
+    def close(self) -> None:
+        self.__connection.commit()
+        self.__connection.close()
+
+
+class DedupSink:
+    @property
+    def new(self) -> int:
+        return self.__new
+
+    @new.setter
+    def new(self, new: int) -> None:
+        raise AttributeError("Cannot set `new`.")
+
+    @new.deleter
+    def new(self) -> None:
+        raise AttributeError("Cannot delete `new`.")
+
+    @property
+    def duplicates(self) -> int:
+        return self.__duplicates
+
+    @duplicates.setter
+    def duplicates(self, duplicates: int) -> None:
+        raise AttributeError("Cannot set `duplicates`.")
+
+    @duplicates.deleter
+    def duplicates(self) -> None:
+        raise AttributeError("Cannot delete `duplicates`.")
+
+    @property
+    def queries(self) -> dict[str, tuple[int, int]]:
+        return self.__queries
+
+    @queries.setter
+    def queries(self, queries: dict[str, tuple[int, int]]) -> None:
+        raise AttributeError("Cannot set `queries`.")
+
+    @queries.deleter
+    def queries(self) -> None:
+        raise AttributeError("Cannot delete `queries`.")
+
+    def __init__(
+        self,
+        index: SeenIndex | NoneType = None,
+        path: str | Path | NoneType = None,
+    ) -> None:
+        """
+        Global email deduplication sink.
+
+        Accepts the scraped emails of every query, keeps the ones not seen before in the run and counts
+        new and duplicate emails per query. New emails are appended to `path` one per line, so the output
+        grows with unique people rather than with query hits.
+
+        Args:
+            index (SeenIndex | NoneType, optional): index of seen emails. Defaults to None, meaning a `SetIndex`.
+            path (str | Path | NoneType, optional): file to append new emails to. Defaults to None.
+        """
+        validate(index, (SeenIndex, NoneType))
+        validate(path, (str, Path, NoneType))
+
+        self.__index: SeenIndex = index if index is not None else SetIndex()
+        self.__file: TextIO | NoneType = open(path, "a") if path is not None else None
+
+        self.__new: int = 0
+        self.__duplicates: int = 0
+        self.__queries: dict[str, tuple[int, int]] = {}
+
+    def __enter__(self) -> "DedupSink":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def feed(self, url: str, emails: Iterable[str]) -> list[str]:
+        """
+        Add the emails scraped from `url`.
+
+        Args:
+            url (str): query url.
+            emails (Iterable[str]): scraped emails.
+
+        Returns:
+            list[str]: emails not seen before.
+        """
+        emails = list(emails)
+        new: list[str] = [email for email in emails if self.__index.add(email)]
+        duplicates: int = len(emails) - len(new)
+
+        self.__new += len(new)
+        self.__duplicates += duplicates
+        self.__queries[url] = (len(new), duplicates)
+
+        if self.__file is not None and new:
+            self.__file.write("\n".join(new) + "\n")
+
+        return new
+
+    def consume(
+        self, results: Iterable[tuple[int, str, Iterable[str]]]
+    ) -> Iterator[tuple[int, str, list[str]]]:
+        """
+        Feed a stream of results, e.g. `Scraper.iter_results()`.
+
+        Args:
+            results (Iterable[tuple[int, str, Iterable[str]]]): url iteration numbers, urls and scraped emails.
+
+        Yields:
+            Iterator[tuple[int, str, list[str]]]: url iteration number, url and emails not seen before.
+        """
+        for i, url, emails in results:
+            yield i, url, self.feed(url, emails or [])
+
+    def close(self) -> None:
+        """
+        Close the output file and the index.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+        self.__index.close()
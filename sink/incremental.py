@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from types import NoneType
+from typing import Any, Iterable
+from validate import validate
+
+
+def fingerprint(emails: Iterable[str]) -> str:
+    """
+    Fingerprint of the result set of a query, independent of order and duplicates.
+
+    Args:
+        emails (Iterable[str]): emails.
+
+    Returns:
+        str: hex digest.
+    """
+    return hashlib.sha256("\n".join(sorted(set(emails))).encode("utf-8")).hexdigest()[:32]
+
+
+class SweepState:
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    @property
+    def refreshed(self) -> int:
+        return len(self.__refreshed)
+
+    @refreshed.setter
+    def refreshed(self, refreshed: int) -> None:
+        raise AttributeError("Cannot set `refreshed`.")
+
+    @refreshed.deleter
+    def refreshed(self) -> None:
+        raise AttributeError("Cannot delete `refreshed`.")
+
+    @property
+    def changed(self) -> int:
+        return self.__changed
+
+    @changed.setter
+    def changed(self, changed: int) -> None:
+        raise AttributeError("Cannot set `changed`.")
+
+    @changed.deleter
+    def changed(self) -> None:
+        raise AttributeError("Cannot delete `changed`.")
+
+    def __init__(self, path: str | Path | Any) -> None:
+        """
+        Per query state of a repeated sweep, for incremental re-scrapes.
+
+        Keeps the emails, result fingerprint, last check time and churn (how often the result changed)
+        of every query of the previous runs. `order` puts unseen, high churn and stale queries first so a
+        refresh can stop after a fraction of the queries, queries not refreshed keep their previous
+        results. `commit` writes only the emails added and removed since the previous run as a delta file.
+
+        Usage:
+            state = SweepState("sweep.state")
+            scraper = SequentialScraper(state.order(urls, limit=2000), request_func, extract_emails)
+            for i, url, emails in scraper.iter_results():
+                state.feed(url, emails)
+            state.commit("sweep.delta")
+
+        Args:
+            path (str | Path | Any): path of the state file, loaded if it exists.
+        """
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+
+        # url -> {"fingerprint", "emails", "checked", "runs", "changes"}
+        self.__queries: dict[str, dict[str, Any]] = {}
+        self.__refreshed: set[str] = set()
+        self.__changed: int = 0
+
+        if self.__path.exists():
+            with open(self.__path) as state:
+                for line in state:
+                    # skip lines cut short by an interrupted write
+                    try:
+                        query: dict[str, Any] = json.loads(line)
+                        self.__queries[query.pop("url")] = query
+                    except (ValueError, KeyError):
+                        continue
+
+        self.__previous: set[str] = self.emails()
+
+    def emails(self) -> set[str]:
+        """
+        Current emails of every query, refreshed or not.
+
+        Returns:
+            set[str]: emails.
+        """
+        return {email for query in self.__queries.values() for email in query["emails"]}
+
+    def __priority(self, url: str) -> tuple[int, float, float]:
+        query: dict[str, Any] | NoneType = self.__queries.get(url)
+
+        if query is None:
+            return 0, 0.0, 0.0
+
+        # highest churn first, then least recently checked
+        return 1, -query["changes"] / max(query["runs"], 1), query["checked"]
+
+    def order(self, urls: Iterable[str], limit: int | NoneType = None) -> list[str]:
+        """
+        Order query urls for a refresh: never queried first, then by churn, then by staleness.
+
+        Args:
+            urls (Iterable[str]): query urls of the sweep.
+            limit (int | NoneType, optional): number of urls to refresh. Defaults to None, meaning all of them.
+
+        Returns:
+            list[str]: urls to query, in order.
+        """
+        validate(limit, (int, NoneType))
+
+        return sorted(urls, key=self.__priority)[:limit]
+
+    def feed(self, url: str, emails: Iterable[str]) -> bool:
+        """
+        Give the emails found for a query.
+
+        Args:
+            url (str): query url.
+            emails (Iterable[str]): emails on the page.
+
+        Returns:
+            bool: Whether the result changed since the query was last checked.
+        """
+        validate(url, str)
+
+        emails = sorted(set(emails))
+        digest: str = fingerprint(emails)
+        query: dict[str, Any] = self.__queries.setdefault(
+            url, {"fingerprint": None, "emails": [], "checked": 0.0, "runs": 0, "changes": 0}
+        )
+
+        changed: bool = query["fingerprint"] != digest
+
+        if changed and query["fingerprint"] is not None:
+            query["changes"] += 1
+
+        query.update(fingerprint=digest, emails=emails, checked=time.time())
+        query["runs"] += 1
+
+        self.__refreshed.add(url)
+        self.__changed += changed
+
+        return changed
+
+    def delta(self) -> tuple[list[str], list[str]]:
+        """
+        Emails added and removed since the previous run.
+
+        An email is only removed once no query returns it any more, queries not refreshed keep their
+        previous results.
+
+        Returns:
+            tuple[list[str], list[str]]: sorted added and removed emails.
+        """
+        current: set[str] = self.emails()
+
+        return sorted(current - self.__previous), sorted(self.__previous - current)
+
+    def commit(self, delta_path: str | Path | NoneType = None) -> tuple[int, int]:
+        """
+        Save the state and write the delta since the previous run.
+
+        The delta file has one `+email` or `-email` line per added or removed email. The state file is
+        replaced atomically, so an interrupted commit keeps the previous state.
+
+        Args:
+            delta_path (str | Path | NoneType, optional): path of the delta file. Defaults to None, meaning
+                no delta file.
+
+        Returns:
+            tuple[int, int]: number of added and removed emails.
+        """
+        validate(delta_path, (str, Path, NoneType))
+
+        added, removed = self.delta()
+
+        if delta_path is not None:
+            with open(delta_path, "w") as delta:
+                delta.writelines(f"+{email}\n" for email in added)
+                delta.writelines(f"-{email}\n" for email in removed)
+
+        temporary: Path = self.__path.with_name(self.__path.name + ".tmp")
+
+        with open(temporary, "w") as state:
+            for url, query in self.__queries.items():
+                state.write(json.dumps({"url": url, **query}) + "\n")
+
+        os.replace(temporary, self.__path)
+
+        self.__previous = self.emails()
+        self.__refreshed.clear()
+        self.__changed = 0
+
+        return len(added), len(removed)
@@ -0,0 +1,255 @@
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from types import NoneType
+from typing import Any, Iterable, Iterator, NamedTuple
+from cwru.parser import DirectoryRecord
+from validate import validate
+
+# sorts after every other character, `prefix <= email < prefix + _MAX_CHAR` selects a prefix
+_MAX_CHAR: str = "\U0010ffff"
+
+_COLUMNS: str = "email, name, category, department, query, first_seen, last_seen"
+
+
+class StoredRecord(NamedTuple):
+    """
+    A person in a `ResultStore`.
+    """
+
+    email: str
+    name: str
+    category: str
+    department: str
+    query: str
+    first_seen: float
+    last_seen: float
+
+
+class ResultStore:
+    @property
+    def path(self) -> Path:
+        return self.__path
+
+    @path.setter
+    def path(self, path: str | Path | Any) -> None:
+        raise AttributeError("Cannot set `path`.")
+
+    @path.deleter
+    def path(self) -> None:
+        raise AttributeError("Cannot delete `path`.")
+
+    def __init__(self, path: str | Path | Any, batch_size: int = 1000) -> None:
+        """
+        Indexed SQLite store of scrape results, one record per unique email.
+
+        Every record keeps the query it was first found by and when it was first and last seen, found
+        again it is updated in place. Writes are buffered and committed `batch_size` at a time, lookups
+        by email or email prefix use the unique email index.
+
+        Args:
+            path (str | Path | Any): path of the database file.
+            batch_size (int, optional): number of buffered records per write. Defaults to 1000.
+        """
+        validate(batch_size, int)
+
+        if batch_size < 1:
+            raise ValueError(f"Expected `batch_size` >= 1, got: '{batch_size}'.")
+
+        self.__path: Path = Path(path) if not isinstance(path, Path) else path
+        self.__batch_size: int = batch_size
+        self.__pending: list[tuple[str, str, str, str, str, float, float]] = []
+        self.__lock: Lock = Lock()
+
+        self.__connection: sqlite3.Connection = sqlite3.connect(
+            self.__path, check_same_thread=False
+        )
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "email TEXT PRIMARY KEY, name TEXT, category TEXT, department TEXT,"
+            " query TEXT, first_seen REAL, last_seen REAL) WITHOUT ROWID"
+        )
+        self.__connection.commit()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self.flush()
+
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def add(
+        self,
+        query: str,
+        results: Iterable[str | DirectoryRecord],
+        timestamp: float | NoneType = None,
+    ) -> None:
+        """
+        Add the results of a query.
+
+        Args:
+            query (str): source query url.
+            results (Iterable[str | DirectoryRecord]): emails, or records from `cwru.parser.parse_records`.
+            timestamp (float | NoneType, optional): when the results were found. Defaults to None, meaning now.
+        """
+        validate(query, str)
+        validate(timestamp, (int, float, NoneType))
+
+        timestamp = time.time() if timestamp is None else timestamp
+
+        rows: list[tuple[str, str, str, str, str, float, float]] = [
+            (result, "", "", "", query, timestamp, timestamp)
+            if isinstance(result, str)
+            else (
+                result.email,
+                result.name,
+                result.category,
+                result.department,
+                query,
+                timestamp,
+                timestamp,
+            )
+            for result in results
+        ]
+
+        with self.__lock:
+            self.__pending += rows
+
+            if len(self.__pending) >= self.__batch_size:
+                self.__write()
+
+    def consume(
+        self, results: Iterable[tuple[int, str, Iterable[str | DirectoryRecord]]]
+    ) -> Iterator[tuple[int, str, Any]]:
+        """
+        Add a stream of results, e.g. `Scraper.iter_results()`, passing them on.
+
+        Args:
+            results (Iterable[tuple[int, str, Iterable[str | DirectoryRecord]]]): url iteration numbers,
+                urls and scraped emails or records.
+
+        Yields:
+            Iterator[tuple[int, str, Any]]: url iteration number, url and scraped result.
+        """
+        for i, url, result in results:
+            self.add(url, result or [])
+
+            yield i, url, result
+
+    def __write(self) -> None:
+        # keep the first query and first seen time, fill in details found later
+        self.__connection.executemany(
+            f"INSERT INTO records ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (email) DO UPDATE SET"
+            " name = CASE WHEN excluded.name != '' THEN excluded.name ELSE name END,"
+            " category = CASE WHEN excluded.category != '' THEN excluded.category ELSE category END,"
+            " department = CASE WHEN excluded.department != '' THEN excluded.department ELSE department END,"
+            " last_seen = MAX(last_seen, excluded.last_seen)",
+            self.__pending,
+        )
+        self.__connection.commit()
+        self.__pending = []
+
+    def flush(self) -> None:
+        """
+        Write buffered records.
+        """
+        with self.__lock:
+            if self.__pending:
+                self.__write()
+
+    def remove(self, emails: Iterable[str]) -> None:
+        """
+        Remove records, e.g. emails a refresh no longer finds.
+
+        Args:
+            emails (Iterable[str]): emails to remove.
+        """
+        self.flush()
+
+        with self.__lock:
+            self.__connection.executemany(
+                "DELETE FROM records WHERE email = ?", ((email,) for email in emails)
+            )
+            self.__connection.commit()
+
+    def get(self, email: str) -> StoredRecord | NoneType:
+        """
+        Look up a record by email.
+
+        Args:
+            email (str): email.
+
+        Returns:
+            StoredRecord | NoneType: record, or None if the email is not stored.
+        """
+        validate(email, str)
+
+        self.flush()
+
+        with self.__lock:
+            row: tuple | NoneType = self.__connection.execute(
+                f"SELECT {_COLUMNS} FROM records WHERE email = ?", (email,)
+            ).fetchone()
+
+        return StoredRecord(*row) if row is not None else None
+
+    def prefix(self, prefix: str) -> list[StoredRecord]:
+        """
+        Look up the records with emails starting with `prefix`, as a range scan of the email index.
+
+        Args:
+            prefix (str): email prefix.
+
+        Returns:
+            list[StoredRecord]: records, sorted by email.
+        """
+        validate(prefix, str)
+
+        self.flush()
+
+        with self.__lock:
+            rows: list[tuple] = self.__connection.execute(
+                f"SELECT {_COLUMNS} FROM records WHERE email >= ? AND email < ? ORDER BY email",
+                (prefix, prefix + _MAX_CHAR),
+            ).fetchall()
+
+        return [StoredRecord(*row) for row in rows]
+
+    def __iter__(self) -> Iterator[StoredRecord]:
+        self.flush()
+
+        # page through the email index `batch_size` records at a time, so the table is never held in
+        # memory whole and records can be added while iterating
+        after: str | NoneType = None
+
+        while True:
+            with self.__lock:
+                rows: list[tuple] = self.__connection.execute(
+                    f"SELECT {_COLUMNS} FROM records"
+                    + (" WHERE email > ?" if after is not None else "")
+                    + " ORDER BY email LIMIT ?",
+                    (after, self.__batch_size) if after is not None else (self.__batch_size,),
+                ).fetchall()
+
+            yield from (StoredRecord(*row) for row in rows)
+
+            if len(rows) < self.__batch_size:
+                return
+
+            after = rows[-1][0]
+
+    def close(self) -> None:
+        """
+        Write buffered records and close the database.
+        """
+        self.flush()
+
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,157 @@
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Barrier, Lock, Thread
+import pytest
+from cwru.session import AuthenticatedSession, SessionProvider
+
+RESULTS: str = "<table><tr><td>Ann Lee</td><td>axl1@case.edu</td></tr></table>"
+PROMPT: str = '<p>More results found, <a href="/login">Log in</a> to see them.</p>'
+
+
+class StandInServer(ThreadingHTTPServer):
+    def __init__(self, stale: str = "prompt") -> None:
+        """
+        Stand-in login and directory server that only accepts the cookie of the latest login.
+
+        Args:
+            stale (str, optional): response to a stale cookie, "prompt", "401", "403" or "redirect".
+                Defaults to "prompt".
+        """
+        self.stale: str = stale
+        self.token: str | None = None
+        self.requests: int = 0
+        self.__tokens = count()
+        self._lock: Lock = Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.requests += 1
+                    valid: bool = server.token is not None and (
+                        self.headers.get("Cookie") == f"session={server.token}"
+                    )
+
+                status, body, headers = 200, RESULTS, {}
+
+                if not valid and server.stale == "prompt":
+                    body = PROMPT
+                elif not valid and server.stale == "redirect":
+                    status, body, headers = 302, "", {"Location": "/login"}
+                elif not valid:
+                    status, body = int(server.stale), "denied"
+
+                data: bytes = body.encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+
+                for name, value in headers.items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+                self.wfile.write(data)
+
+        super().__init__(("127.0.0.1", 0), Handler)
+
+        Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/directory/lookup?search_text=ax*"
+
+    def login(self) -> str:
+        # a new login makes every earlier cookie stale
+        with self._lock:
+            self.token = str(next(self.__tokens))
+
+            return self.token
+
+    def expire(self) -> None:
+        with self._lock:
+            self.token = None
+
+
+class StandInProvider(SessionProvider):
+    def __init__(self, server: StandInServer, delay: float = 0.0) -> None:
+        self.server: StandInServer = server
+        self.delay: float = delay
+
+    def login(self) -> dict[str, str]:
+        time.sleep(self.delay)
+
+        return {"session": self.server.login()}
+
+
+@pytest.fixture
+def server():
+    server = StandInServer()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_one_login_for_many_requests(server: StandInServer) -> None:
+    session = AuthenticatedSession(StandInProvider(server))
+
+    for _ in range(20):
+        assert session.request(server.url) == RESULTS
+
+    assert session.logins == 1
+    assert server.requests == 20
+
+    session.close()
+
+
+@pytest.mark.parametrize("stale", ["prompt", "401", "403", "redirect"])
+def test_login_again_when_expired(server: StandInServer, stale: str) -> None:
+    server.stale = stale
+    session = AuthenticatedSession(StandInProvider(server))
+
+    assert session.request(server.url) == RESULTS
+
+    server.expire()
+
+    assert session.request(server.url) == RESULTS
+    assert session.logins == 2
+
+    session.close()
+
+
+def test_concurrent_expiry_logs_in_once(server: StandInServer) -> None:
+    # a slow login, so every thread sees the session expire before it is renewed
+    session = AuthenticatedSession(StandInProvider(server, delay=0.2))
+    session.request(server.url)
+    server.expire()
+
+    threads: int = 8
+    barrier: Barrier = Barrier(threads)
+    results: list[str] = []
+
+    def request() -> None:
+        barrier.wait()
+        results.append(session.request(server.url))
+
+    workers: list[Thread] = [Thread(target=request) for _ in range(threads)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    assert results == [RESULTS] * threads
+    assert session.logins == 2
+
+    session.close()
@@ -1 +1,2 @@
-from validate.vval import validate_iterable, validate, is_callable, validate_option
\ No newline at end of file
+from validate.vval import validate_iterable, validate, is_callable, validate_option
+from validate.vval import compile_validator, set_validation, validation_enabled, Validator
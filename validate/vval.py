@@ -16,6 +16,37 @@ class ValidationError(Error):
     pass
 
 
+_enabled: bool = True
+
+
+def set_validation(enabled: bool) -> None:
+    """
+    Globally turn type validation on or off.
+
+    When off, `validate`, `validate_iterable` and compiled validators accept every value without
+    checking it. `validate_option` is not affected.
+
+    Args:
+        enabled (bool): Whether to validate.
+    """
+    global _enabled
+
+    if not isinstance(enabled, bool):
+        raise TypeError(f"Expected 'bool' for `enabled`, got: '{type(enabled).__name__}'.")
+
+    _enabled = enabled
+
+
+def validation_enabled() -> bool:
+    """
+    Check if type validation is globally turned on.
+
+    Returns:
+        bool: Whether type validation is on.
+    """
+    return _enabled
+
+
 def is_union(obj: Any) -> bool:
     """
     Check if `obj` is a Union.
@@ -161,6 +192,10 @@ def validate(
         Due to this, just including `typing.Iterable` in `type_iter` will not work, and for this
         reason there is a function `validate_iterable` that can be used instead.
     """
+    # skip validation if it is globally turned off
+    if not _enabled:
+        return True
+
     # list of allowed types
     allowed_types: list[type | Type] = []
 
@@ -202,6 +237,102 @@ def validate(
     )
 
 
+class Validator:
+    def __init__(self, types: tuple[type, ...], callable_: bool, name: str) -> None:
+        """
+        Precompiled type validator, see `compile_validator`.
+
+        Args:
+            types (tuple[type, ...]): Valid types.
+            callable_ (bool): Whether any callable is valid.
+            name (str): Name of the validated variable used in error messages.
+        """
+        self.__types: tuple[type, ...] = types
+        self.__callable: bool = callable_
+        self.__name: str = name
+        self.__expected: str = ", ".join(
+            [type_.__name__ for type_ in types] + (["Callable"] if callable_ else [])
+        )
+
+    def __call__(self, value: Any) -> bool:
+        """
+        Validate that `value` is of one of the compiled types.
+
+        Args:
+            value (Any): Value to be checked.
+
+        Raises:
+            TypeError: If `value` is not of one of the compiled types.
+
+        Returns:
+            bool: True if `value` is valid.
+        """
+        if (
+            not _enabled
+            or isinstance(value, self.__types)
+            or (self.__callable and callable(value))
+        ):
+            return True
+
+        raise TypeError(
+            f"Expected '{self.__expected}' for `{self.__name}`, got: '{type(value).__name__}'."
+        )
+
+
+def compile_validator(
+    type_: type
+    | Type
+    | UnionType
+    | Iterable[type | Type | UnionType | Iterable[type | Type | UnionType]],
+    name: str = "value",
+) -> Validator:
+    """
+    Compile a validator for `type_`.
+
+    `type_` is parsed once into a flat tuple of types, so every call of the returned validator is
+    a single `isinstance` check. Use this instead of `validate` on hot paths.
+
+    Args:
+        type_ (type | Type | UnionType | Iterable[type | Type | UnionType]): Valid type(s), as accepted by `validate`.
+        name (str, optional): Name of the validated variable used in error messages. Defaults to "value".
+
+    Returns:
+        Validator: Validator for `type_`.
+    """
+    # list of allowed types
+    allowed_types: list[type | Type] = []
+
+    # extract allowed types the same way `validate` does
+    if isinstance(type_, UnionType):
+        allowed_types += list(get_args(type_))
+    elif is_iterable(type_):
+        if is_union(type_):
+            allowed_types += list(get_args(type_))
+        else:
+            allowed_types = __extract_types(type_)
+    elif (
+        isinstance(type_, Type)
+        or isinstance(type_, type)
+        or isinstance(type_, Callable)
+    ):
+        allowed_types.append(type_)
+    else:
+        raise TypeError(
+            f"Expected 'type', 'Type', 'UnionType', or 'Iterable[type | Type | UnionType]' for `type_` got: '{type_}'."
+        )
+
+    # check generic types up front, because generic types can't be validated
+    for allowed_type in allowed_types:
+        if allowed_type != Callable and is_generic(allowed_type):
+            raise ValidationError(f"Can't validate generic type: '{allowed_type}'.")
+
+    return Validator(
+        tuple(allowed_type for allowed_type in allowed_types if allowed_type != Callable),
+        any(allowed_type == Callable for allowed_type in allowed_types),
+        name,
+    )
+
+
 def validate_iterable(
     iter_: Iterable,
     type_: type | Type | UnionType | Iterable[type | Type | UnionType],
@@ -225,6 +356,10 @@ def validate_iterable(
             f"Expected 'Iterable' for `iter_`, got: '{type(iter_).__name__}'."
         )
 
+    # skip validation if it is globally turned off
+    if not _enabled:
+        return True
+
     # validate every value in iter against type_
     for value in iter_:
         validate(value, type_)